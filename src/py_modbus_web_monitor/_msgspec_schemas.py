@@ -0,0 +1,111 @@
+"""msgspec mirrors of the websocket command schemas.
+
+Used only on the open-socket command path, where commands arrive at poll
+rate; the Pydantic models in :mod:`schemas` remain the HTTP/OpenAPI contract.
+Only the strict shape is decoded here: anything these structs reject, and any
+write value Pydantic would coerce, is handed to the Pydantic decoder so both
+paths give the same answer.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Callable, List, Literal, Optional, Union
+
+import msgspec
+
+from .schemas import WriteOperation
+
+_Meta = msgspec.Meta
+
+
+class ConnectionSettingsStruct(msgspec.Struct, forbid_unknown_fields=True):
+    host: str
+    protocol: Literal["tcp"] = "tcp"
+    port: Annotated[int, _Meta(ge=1, le=65535)] = 502
+    unit_id: Annotated[int, _Meta(ge=0, le=255)] = msgspec.field(
+        default=1, name="unitId"
+    )
+    timeout: Annotated[float, _Meta(gt=0)] = 3.0
+
+
+class ReadTargetStruct(msgspec.Struct, forbid_unknown_fields=True):
+    kind: Literal["holding", "input", "coil", "discrete"]
+    address: Annotated[int, _Meta(ge=0)]
+    count: Annotated[int, _Meta(ge=1, le=125)] = 1
+    label: Optional[str] = None
+
+
+class WriteOperationStruct(msgspec.Struct, forbid_unknown_fields=True):
+    kind: Literal["holding", "coil"]
+    address: Annotated[int, _Meta(ge=0)]
+    value: Union[int, bool, List[Union[int, bool]]]
+
+
+class _CommandBase(
+    msgspec.Struct, forbid_unknown_fields=True, kw_only=True, tag_field="type"
+):
+    connection: Optional[ConnectionSettingsStruct] = None
+    interval: Optional[float] = None
+    targets: Optional[List[ReadTargetStruct]] = None
+    writes: Optional[List[WriteOperationStruct]] = None
+    encoding: Literal["json", "binary"] = "json"
+
+
+class ConfigureCommandStruct(_CommandBase, tag="configure"):
+    connection: ConnectionSettingsStruct
+    targets: Annotated[List[ReadTargetStruct], _Meta(min_length=1)]
+
+
+class WriteCommandStruct(_CommandBase, tag="write"):
+    writes: Annotated[List[WriteOperationStruct], _Meta(min_length=1)]
+
+
+class PingCommandStruct(_CommandBase, tag="ping"):
+    pass
+
+
+MonitorCommandStruct = Union[
+    ConfigureCommandStruct, WriteCommandStruct, PingCommandStruct
+]
+
+
+_DecodeResult = tuple[str, List[WriteOperation]]
+
+
+def _is_strict_value(value: Any) -> bool:
+    """True for values Pydantic's ``WriteOperation`` keeps exactly as decoded."""
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        return True
+    if value_type is not list:
+        return False
+    if not value:
+        return True
+    first = type(value[0])
+    return (first is int or first is bool) and all(type(v) is first for v in value)
+
+
+class CommandDecoder:
+    """Decode and validate a websocket command in a single pass."""
+
+    def __init__(self, fallback: Callable[[str | bytes], _DecodeResult]) -> None:
+        self._decoder = msgspec.json.Decoder(MonitorCommandStruct)
+        self._fallback = fallback
+
+    def decode(self, raw: str | bytes) -> _DecodeResult:
+        """Return the command type and its (already validated) writes."""
+        try:
+            command = self._decoder.decode(raw)
+        except msgspec.DecodeError:
+            # Lax input (1.0, "5", ...) or an error: Pydantic has the final say.
+            return self._fallback(raw)
+        operations = command.writes or []
+        if not all(_is_strict_value(op.value) for op in operations):
+            return self._fallback(raw)
+        writes = [
+            WriteOperation.model_construct(
+                kind=op.kind, address=op.address, value=op.value
+            )
+            for op in operations
+        ]
+        return type(command).__struct_config__.tag, writes
@@ -0,0 +1,27 @@
+"""STL fit run in the STL worker processes.
+
+Kept out of :mod:`api` so the fork server and its workers import only
+statsmodels, not the FastAPI app.
+"""
+
+from __future__ import annotations
+
+import statistics
+from typing import List, TypeAlias
+
+from statsmodels.tsa.seasonal import STL
+
+# (residual mean, residual stdev, latest residual)
+StlStats: TypeAlias = tuple[float, float, float]
+
+
+def stl_fit_one(values: List[float], period: int) -> StlStats | None:
+    """Fit STL and summarize its residuals."""
+    result = STL(values, period=period, robust=True).fit()
+    residuals = list(result.resid)
+    if len(residuals) < 2:
+        return None
+    history = residuals[:-1]
+    if len(history) < 2:
+        return None
+    return statistics.mean(history), statistics.stdev(history), residuals[-1]
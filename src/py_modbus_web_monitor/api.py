@@ -2,20 +2,59 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import statistics
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Sequence,
+    TypeAlias,
+    TypeVar,
+)
 
-from fastapi import APIRouter, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from . import __version__
-from .data_logger import compute_z_score, get_data_logger, utc_now_iso
-from .modbus_client import ModbusConnectionError, ModbusOperationError, tcp_session
-from .monitor import run_monitor_session
+from .data_logger import (
+    compute_z_score,
+    get_data_logger,
+    shutdown_data_logger,
+    utc_now_iso,
+)
+from .modbus_client import (
+    ModbusConnectionError,
+    ModbusOperationError,
+    close_all_sessions,
+    tcp_session,
+)
+from .monitor import run_monitor_session, send_json_fast
 from .schemas import (
     AnomalyRequest,
     MonitorCommand,
@@ -25,12 +64,185 @@ from .schemas import (
 )
 
 logger = logging.getLogger(__name__)
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Large seasonal periods make the robust STL fit disproportionately expensive.
+_STL_MAX_PERIOD = max(2, int(os.getenv("MODBUS_WEB_MONITOR_STL_MAX_PERIOD", "64")))
+# Below this autocorrelation the series is treated as non-seasonal.
+_MIN_SEASONAL_CORR = 0.2
+# Residual stats of recent STL fits, so repeated polls of an unchanged
+# window skip the LOESS passes.
+_STL_CACHE_TTL = 1.0
+_STL_CACHE_SIZE = 1024
+
+# (host, port, unit_id, kind, address, window length, window hash)
+_StlKey: TypeAlias = tuple[str, int, int, str, int, int, int]
+_StlStats: TypeAlias = tuple[float, float, float]
+_STL_CACHE: dict[_StlKey, tuple[float, _StlStats]] = {}
+# (window length, window hash, max lag) -> estimated period
+_PERIOD_CACHE: dict[tuple[int, int, int], int] = {}
+_PERIOD_CACHE_SIZE = 256
+# STL fits are CPU-bound; spread them over processes (0 uses threads instead).
+# A single fit takes milliseconds, so a few workers cover a whole request.
+_STL_WORKERS = int(
+    os.getenv("MODBUS_WEB_MONITOR_STL_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# Workers are never forked from the server: it already runs threads (anyio,
+# the SQLite writer) whose held locks a forked child would inherit.
+_STL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_STL_POOL: ProcessPoolExecutor | None = None
+# Set when a process pool cannot be created here; fits then use threads.
+_STL_POOL_UNAVAILABLE = False
+
 try:  # pragma: no cover - optional dependency
+    import numpy as np
     from statsmodels.tsa.seasonal import STL
+
+    from . import _stl_worker
+    from ._stl_worker import stl_fit_one as _stl_fit_one
 except Exception:  # noqa: BLE001 - best effort import
     STL = None
+try:  # pragma: no cover - optional dependency
+    import orjson  # noqa: F401 - required by ORJSONResponse
+
+    _HAS_ORJSON = True
+except Exception:  # noqa: BLE001 - fall back to the stdlib encoder
+    _HAS_ORJSON = False
+try:  # pragma: no cover - optional dependency
+    from ._autocorr_numba import estimate_period as _estimate_period_jit
+
+    _HAS_NUMBA = True
+except Exception:  # noqa: BLE001 - fall back to the NumPy implementation
+    _HAS_NUMBA = False
+
+
+def _stl_cache_get(key: _StlKey) -> _StlStats | None:
+    entry = _STL_CACHE.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _STL_CACHE.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _stl_cache_put(key: _StlKey, stats: _StlStats) -> None:
+    if key not in _STL_CACHE and len(_STL_CACHE) >= _STL_CACHE_SIZE:
+        _STL_CACHE.pop(next(iter(_STL_CACHE)))
+    _STL_CACHE[key] = (time.monotonic() + _STL_CACHE_TTL, stats)
+
+
+def _autocorr(values: Sequence[float], max_lag: int) -> np.ndarray:
+    """Autocorrelation for lags ``1..max_lag`` computed in one FFT pass."""
+    centered = np.asarray(values, dtype=np.float64)
+    centered = centered - centered.mean()
+    size = len(centered)
+    spectrum = np.fft.rfft(centered, n=2 * size)
+    acov = np.fft.irfft(spectrum * np.conj(spectrum), n=2 * size)[:size]
+    if acov[0] == 0:
+        return np.zeros(max_lag)
+    return acov[1 : max_lag + 1] / acov[0]
+
 
+def _estimate_period_uncached(values: Sequence[float], max_lag: int) -> int:
+    if len(values) < 4:
+        return 2
+    max_lag = max(1, min(max_lag, len(values) - 2))
+    if _HAS_NUMBA:
+        best_lag, best_corr = _estimate_period_jit(
+            np.asarray(values, dtype=np.float64), max_lag
+        )
+    else:
+        corr = _autocorr(values, max_lag)
+        best_index = int(np.argmax(corr))
+        best_lag, best_corr = best_index + 1, float(corr[best_index])
+    if best_corr < _MIN_SEASONAL_CORR:
+        return 2
+    return max(2, best_lag)
+
+
+def _estimate_period(values: List[float], max_lag: int, window_hash: int) -> int:
+    # Unchanged windows (repeated dashboard polls) reuse the last estimate.
+    # Keyed like _STL_CACHE on the window's length and hash, never the values,
+    # so a full cache stays small however long the windows are.
+    key = (len(values), window_hash, max_lag)
+    period = _PERIOD_CACHE.get(key)
+    if period is None:
+        period = _estimate_period_uncached(values, max_lag)
+        if len(_PERIOD_CACHE) >= _PERIOD_CACHE_SIZE:
+            _PERIOD_CACHE.pop(next(iter(_PERIOD_CACHE)))
+        _PERIOD_CACHE[key] = period
+    return period
+
+
+@dataclass
+class _StlFit:
+    """Where one series' STL stats land in the response lists."""
+
+    key: _StlKey
+    z_scores: List[float | None]
+    means: List[float | None]
+    stdevs: List[float | None]
+    index: int
+    future: asyncio.Future[_StlStats | None] | None = None
+
+    def apply(self, stats: _StlStats) -> None:
+        mean, stdev, last_residual = stats
+        if stdev == 0:
+            z_score = 0.0
+        else:
+            z_score = (last_residual - mean) / stdev
+        self.z_scores[self.index] = z_score
+        self.means[self.index] = mean
+        self.stdevs[self.index] = stdev
+
+
+def _get_stl_pool() -> ProcessPoolExecutor | None:
+    """Return the shared STL worker pool (``None`` means the thread pool)."""
+    global _STL_POOL, _STL_POOL_UNAVAILABLE
+    if _STL_WORKERS <= 0 or _STL_POOL_UNAVAILABLE:
+        return None
+    if _STL_POOL is None:
+        try:
+            context = multiprocessing.get_context(_STL_START_METHOD)
+            if _STL_START_METHOD == "forkserver":
+                # Import statsmodels once in the (single-threaded) fork server
+                # so workers start without re-importing it.
+                context.set_forkserver_preload([_stl_worker.__name__])
+            _STL_POOL = ProcessPoolExecutor(
+                max_workers=_STL_WORKERS, mp_context=context
+            )
+        except (OSError, NotImplementedError, ValueError) as exc:
+            logger.warning("STL process pool unavailable, using threads: %s", exc)
+            _STL_POOL_UNAVAILABLE = True
+            return None
+    return _STL_POOL
 
+
+def _submit_stl_fit(
+    loop: asyncio.AbstractEventLoop, values: List[float], period: int
+) -> asyncio.Future[_StlStats | None]:
+    """Schedule one STL fit, falling back to threads if the pool is broken."""
+    executor = _get_stl_pool()
+    try:
+        return loop.run_in_executor(executor, _stl_fit_one, values, period)
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool on the next request.
+        _shutdown_stl_pool()
+        return loop.run_in_executor(None, _stl_fit_one, values, period)
+
+
+def _shutdown_stl_pool() -> None:
+    global _STL_POOL
+    if _STL_POOL is not None:
+        _STL_POOL.shutdown(wait=False, cancel_futures=True)
+        _STL_POOL = None
+
+
+@lru_cache(maxsize=1)
 def _resolve_dist_dir() -> Path | None:
     package_dist = Path(__file__).resolve().parent / "web"
     if (package_dist / "index.html").exists():
@@ -43,29 +255,99 @@ def _resolve_dist_dir() -> Path | None:
     return None
 
 
+# Request bodies are parsed and validated in one pass (pydantic-core's JSON
+# parser) instead of json.loads + validation of the resulting dict.
+_BODY_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {
+    model: TypeAdapter(model) for model in (ReadRequest, WriteRequest, AnomalyRequest)
+}
+
+
+def _json_body(model: type[_ModelT]) -> Callable[[Request], Awaitable[_ModelT]]:
+    """Dependency that validates the raw request body as ``model``."""
+    adapter = _BODY_ADAPTERS[model]
+
+    async def parse(request: Request) -> _ModelT:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors) from exc
+
+    return parse
+
+
+def _json_response(content: Any) -> JSONResponse:
+    """Serialize ``content`` directly, bypassing FastAPI's jsonable_encoder."""
+    if _HAS_ORJSON:
+        return ORJSONResponse(content)
+    return JSONResponse(content)
+
+
+def _json_body_openapi(model: type[BaseModel]) -> Dict[str, Any]:
+    ref = {"$ref": f"#/components/schemas/{model.__name__}"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ref}},
+        }
+    }
+
+
+def _install_body_schemas(app: FastAPI) -> None:
+    """Publish the request body models that routes no longer declare."""
+    base_openapi = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema:
+            return app.openapi_schema
+        schema = base_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for model in _BODY_ADAPTERS:
+            model_schema = model.model_json_schema(
+                ref_template="#/components/schemas/{model}"
+            )
+            components.update(model_schema.pop("$defs", {}))
+            components[model.__name__] = model_schema
+        return schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await close_all_sessions()
+    await shutdown_data_logger()
+    _shutdown_stl_pool()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Modbus Web Monitor",
         version=__version__,
         description="Monitor Modbus devices with FastAPI + websockets",
+        lifespan=_lifespan,
     )
     router = APIRouter(prefix="/api")
 
-    @router.post("/modbus/read")
-    async def read_modbus(payload: ReadRequest) -> Dict[str, List[dict]]:
+    @router.post("/modbus/read", openapi_extra=_json_body_openapi(ReadRequest))
+    async def read_modbus(
+        payload: Annotated[ReadRequest, Depends(_json_body(ReadRequest))],
+    ) -> JSONResponse:
         try:
             async with tcp_session(payload.connection) as session:
-                readings = []
-                for target in payload.targets:
-                    values = await session.read(target)
-                    readings.append(
-                        {
-                            "address": target.address,
-                            "kind": target.kind,
-                            "label": target.label or f"{target.kind}:{target.address}",
-                            "values": values,
-                        }
-                    )
+                target_values = await session.read_many(payload.targets)
+                readings = [
+                    {
+                        "address": target.address,
+                        "kind": target.kind,
+                        "label": target.label or f"{target.kind}:{target.address}",
+                        "values": values,
+                    }
+                    for target, values in zip(payload.targets, target_values)
+                ]
             data_logger = get_data_logger()
             await data_logger.log_readings(
                 payload.connection,
@@ -73,46 +355,26 @@ def create_app() -> FastAPI:
                 source="read",
                 timestamp=utc_now_iso(),
             )
-            return {"data": readings}
+            return _json_response({"data": readings})
         except (ModbusConnectionError, ModbusOperationError) as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-    @router.post("/modbus/write")
-    async def write_modbus(payload: WriteRequest) -> Dict[str, str | int]:
+    @router.post("/modbus/write", openapi_extra=_json_body_openapi(WriteRequest))
+    async def write_modbus(
+        payload: Annotated[WriteRequest, Depends(_json_body(WriteRequest))],
+    ) -> JSONResponse:
         try:
             async with tcp_session(payload.connection) as session:
                 for op in payload.writes:
                     await session.write(op)
-            return {"status": "ok", "writes": len(payload.writes)}
+            return _json_response({"status": "ok", "writes": len(payload.writes)})
         except (ModbusConnectionError, ModbusOperationError) as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-    def _autocorr(values: List[float], lag: int) -> float:
-        size = len(values) - lag
-        if size <= 1:
-            return 0.0
-        mean = sum(values) / len(values)
-        denom = sum((value - mean) ** 2 for value in values)
-        if denom == 0:
-            return 0.0
-        num = sum((values[i] - mean) * (values[i + lag] - mean) for i in range(size))
-        return num / denom
-
-    def _estimate_period(values: List[float], max_lag: int) -> int:
-        if len(values) < 4:
-            return 2
-        max_lag = max(1, min(max_lag, len(values) - 2))
-        best_lag = 1
-        best_corr = float("-inf")
-        for lag in range(1, max_lag + 1):
-            corr = _autocorr(values, lag)
-            if corr > best_corr:
-                best_corr = corr
-                best_lag = lag
-        return max(2, best_lag)
-
-    @router.post("/anomaly/zscore")
-    async def anomaly_zscore(payload: AnomalyRequest) -> Dict[str, List[dict]]:
+    @router.post("/anomaly/zscore", openapi_extra=_json_body_openapi(AnomalyRequest))
+    async def anomaly_zscore(
+        payload: Annotated[AnomalyRequest, Depends(_json_body(AnomalyRequest))],
+    ) -> JSONResponse:
         data_logger = get_data_logger()
         results: List[dict] = []
         for target in payload.targets:
@@ -121,14 +383,16 @@ def create_app() -> FastAPI:
             sample_counts: List[int] = []
             means: List[float | None] = []
             stdevs: List[float | None] = []
+            series = await data_logger.fetch_recent_values_range(
+                payload.connection,
+                kind=target.kind,
+                base_address=target.address,
+                count=target.count,
+                limit=payload.window,
+            )
             for offset in range(target.count):
                 address = target.address + offset
-                values = await data_logger.fetch_recent_values(
-                    payload.connection,
-                    kind=target.kind,
-                    address=address,
-                    limit=payload.window,
-                )
+                values = series[address]
                 if not values:
                     latest_values.append(None)
                     z_scores.append(None)
@@ -154,32 +418,39 @@ def create_app() -> FastAPI:
                     "stdev": stdevs,
                 }
             )
-        return {"data": results}
+        return _json_response({"data": results})
 
-    @router.post("/anomaly/stl")
-    async def anomaly_stl(payload: AnomalyRequest) -> Dict[str, List[dict]]:
+    @router.post("/anomaly/stl", openapi_extra=_json_body_openapi(AnomalyRequest))
+    async def anomaly_stl(
+        payload: Annotated[AnomalyRequest, Depends(_json_body(AnomalyRequest))],
+    ) -> JSONResponse:
         if STL is None:
             raise HTTPException(
                 status_code=503,
                 detail="STL requires statsmodels. Install py-modbus-web-monitor[ml].",
             )
         data_logger = get_data_logger()
+        loop = asyncio.get_running_loop()
         results: List[dict] = []
+        # Cache misses are fitted concurrently once every series is fetched.
+        fits: List[_StlFit] = []
         for target in payload.targets:
             latest_values: List[float | None] = []
             z_scores: List[float | None] = []
             sample_counts: List[int] = []
             means: List[float | None] = []
             stdevs: List[float | None] = []
+            series = await data_logger.fetch_recent_values_range(
+                payload.connection,
+                kind=target.kind,
+                base_address=target.address,
+                count=target.count,
+                limit=payload.window,
+                oldest_first=True,
+            )
             for offset in range(target.count):
                 address = target.address + offset
-                values = await data_logger.fetch_recent_values(
-                    payload.connection,
-                    kind=target.kind,
-                    address=address,
-                    limit=payload.window,
-                )
-                values = list(reversed(values))
+                values = series[address]
                 if not values:
                     latest_values.append(None)
                     z_scores.append(None)
@@ -189,44 +460,32 @@ def create_app() -> FastAPI:
                     continue
                 latest_values.append(values[-1])
                 sample_counts.append(len(values))
+                z_scores.append(None)
+                means.append(None)
+                stdevs.append(None)
                 if len(values) < payload.min_samples:
-                    z_scores.append(None)
-                    means.append(None)
-                    stdevs.append(None)
-                    continue
-                period = _estimate_period(values, max_lag=min(100, len(values) - 2))
-                try:
-                    stl = STL(values, period=period, robust=True)
-                    result = stl.fit()
-                except Exception as exc:  # noqa: BLE001 - return partial results
-                    logger.warning(
-                        "STL failed for %s:%s: %s", target.kind, address, exc
-                    )
-                    z_scores.append(None)
-                    means.append(None)
-                    stdevs.append(None)
                     continue
-                residuals = list(result.resid)
-                if len(residuals) < 2:
-                    z_scores.append(None)
-                    means.append(None)
-                    stdevs.append(None)
-                    continue
-                history = residuals[:-1]
-                if len(history) < 2:
-                    z_scores.append(None)
-                    means.append(None)
-                    stdevs.append(None)
+                stl_key: _StlKey = (
+                    payload.connection.host,
+                    payload.connection.port,
+                    payload.connection.unit_id,
+                    target.kind,
+                    address,
+                    len(values),
+                    hash(tuple(values)),
+                )
+                fit = _StlFit(stl_key, z_scores, means, stdevs, offset)
+                stats = _stl_cache_get(stl_key)
+                if stats is not None:
+                    fit.apply(stats)
                     continue
-                mean = statistics.mean(history)
-                stdev = statistics.stdev(history)
-                if stdev == 0:
-                    z_score = 0.0
-                else:
-                    z_score = (residuals[-1] - mean) / stdev
-                z_scores.append(z_score)
-                means.append(mean)
-                stdevs.append(stdev)
+                period = _estimate_period(
+                    values,
+                    max_lag=min(_STL_MAX_PERIOD, len(values) - 2),
+                    window_hash=stl_key[6],
+                )
+                fit.future = _submit_stl_fit(loop, values, period)
+                fits.append(fit)
             results.append(
                 {
                     "address": target.address,
@@ -239,9 +498,26 @@ def create_app() -> FastAPI:
                     "stdev": stdevs,
                 }
             )
-        return {"data": results}
+        outcomes = await asyncio.gather(
+            *(fit.future for fit in fits if fit.future is not None),
+            return_exceptions=True,
+        )
+        for fit, outcome in zip(fits, outcomes):
+            if isinstance(outcome, BrokenProcessPool):
+                _shutdown_stl_pool()
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "STL failed for %s:%s: %s", fit.key[3], fit.key[4], outcome
+                )
+                continue
+            if outcome is None:
+                continue
+            _stl_cache_put(fit.key, outcome)
+            fit.apply(outcome)
+        return _json_response({"data": results})
 
     app.include_router(router)
+    _install_body_schemas(app)
 
     # Permissive CORS for local dev; tighten in production.
     app.add_middleware(
@@ -257,14 +533,14 @@ def create_app() -> FastAPI:
         await websocket.accept()
         try:
             raw = await websocket.receive_text()
-            data = json.loads(raw)
-            command = MonitorCommand.model_validate(data)
+            command = MonitorCommand.model_validate_json(raw)
             if command.type != "configure":
-                await websocket.send_json(
+                await send_json_fast(
+                    websocket,
                     {
                         "type": "error",
                         "message": "First message must be a 'configure' command",
-                    }
+                    },
                 )
                 await websocket.close()
                 return
@@ -273,6 +549,7 @@ def create_app() -> FastAPI:
                 connection=command.connection,
                 interval=command.interval or 1.0,
                 targets=command.targets or [],
+                encoding=command.encoding,
             )
             logger.info(
                 "WebSocket configure: host=%s port=%s unit=%s targets=%d interval=%.3f",
@@ -282,15 +559,16 @@ def create_app() -> FastAPI:
                 len(config.targets),
                 config.interval,
             )
-            await websocket.send_json(
+            await send_json_fast(
+                websocket,
                 {
                     "type": "status",
                     "message": f"Config set for {config.connection.host}:{config.connection.port} (unit {config.connection.unit_id})",
-                }
+                },
             )
         except Exception as exc:  # noqa: BLE001 - send details to client
-            await websocket.send_json(
-                {"type": "error", "message": f"Invalid configuration: {exc}"}
+            await send_json_fast(
+                websocket, {"type": "error", "message": f"Invalid configuration: {exc}"}
             )
             await websocket.close()
             return
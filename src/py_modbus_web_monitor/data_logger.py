@@ -8,19 +8,77 @@ import os
 import sqlite3
 import statistics
 import threading
-from dataclasses import dataclass
+import time
+from contextlib import suppress
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Callable, Iterable, Sequence, TypeAlias
 
 from .schemas import ConnectionSettings
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    _HAS_NUMPY = True
+except Exception:  # noqa: BLE001 - best effort import
+    _HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
+_SeriesKey: TypeAlias = tuple[str, int, int, str, int]
+# Row tuple in INSERT column order:
+# (timestamp, source, host, port, unit_id, kind, address, value, label)
+LoggedReading: TypeAlias = tuple[str, str, str, int, int, str, int, float, str | None]
+
 _ALLOWED_KINDS = {"holding", "input", "coil", "discrete"}
 _DEFAULT_KINDS = {"holding", "input"}
+_BIT_KINDS = {"coil", "discrete"}
 _DEFAULT_DB_NAME = "modbus_readings_{date}.sqlite"
 _DATE_FORMAT = "%Y-%m-%d_%H-%M-%S"
+_DEFAULT_MAX_BATCH = 500
+_DEFAULT_MAX_DELAY_MS = 50
+_DEFAULT_CACHE_TTL_MS = 500
+_DEFAULT_MAX_QUEUE = 100_000
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+# Module constants (and cached INSERT strings) let sqlite3's statement cache
+# reuse the prepared form.
+_INSERT_PREFIX = """
+    INSERT INTO readings (
+        timestamp, source, host, port, unit_id, kind, address, value, label
+    ) VALUES
+"""
+_INSERT_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_COLUMNS = 9
+# SQLite >= 3.32 allows 32766 bound parameters per statement, older builds 999.
+_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+_MAX_ROWS_PER_INSERT = _MAX_VARIABLES // _INSERT_COLUMNS
+_SELECT_RECENT_SQL = """
+    SELECT value
+    FROM readings
+    WHERE host = ? AND port = ? AND unit_id = ? AND kind = ? AND address = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+# One LIMITed probe of the series index per address, so the cost follows the
+# window size rather than the stored history. ?1-?4 are the series columns and
+# ?5 the limit; addresses are bound from ?6 on.
+_SELECT_RECENT_RANGE_MEMBER = """
+    SELECT * FROM (
+        SELECT address, value, id
+        FROM readings
+        WHERE host = ?1 AND port = ?2 AND unit_id = ?3 AND kind = ?4
+            AND address = ?{param}
+        ORDER BY id DESC
+        LIMIT ?5
+    )
+"""
 
 
 def _parse_bool(value: str | None, default: bool) -> bool:
@@ -48,47 +106,135 @@ def _resolve_db_path() -> Path:
     return Path.cwd() / "outputs" / filename
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") swapped as one tuple so threads
+# never see a second paired with another second's prefix.
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Current UTC time as ISO-8601 with microseconds and a +00:00 offset."""
+    global _iso_second_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+@lru_cache(maxsize=64)
+def _insert_sql(rows: int) -> str:
+    """Multi-row INSERT with ``rows`` value groups."""
+    return _INSERT_PREFIX + ", ".join([_INSERT_ROW] * rows)
+
+
+@lru_cache(maxsize=64)
+def _recent_range_sql(count: int, oldest_first: bool) -> str:
+    """Latest values for ``count`` addresses, grouped by address."""
+    members = " UNION ALL ".join(
+        _SELECT_RECENT_RANGE_MEMBER.format(param=6 + offset) for offset in range(count)
+    )
+    order = "ASC" if oldest_first else "DESC"
+    return f"SELECT address, value FROM ({members}) ORDER BY address, id {order}"
+
+
+def _parse_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+    try:
+        return int(value.strip())
+    except ValueError:
+        return default
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _cancel_task(task: asyncio.Task[None]) -> None:
+    """Cancel ``task`` from any thread; a no-op once its loop has closed."""
+    loop = task.get_loop()
+    if loop.is_closed():
+        return
+    if loop is _running_loop():
+        task.cancel()
+    else:
+        loop.call_soon_threadsafe(task.cancel)
+
+
+def _drain(queue: asyncio.Queue[LoggedReading]) -> list[LoggedReading]:
+    items: list[LoggedReading] = []
+    while True:
+        try:
+            items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return items
 
 
 def compute_z_score(
-    values: Sequence[float], min_samples: int
+    values: Sequence[float] | np.ndarray, min_samples: int
 ) -> tuple[float | None, float | None, float | None]:
+    """Score ``values[0]`` against the rest of the window (newest first)."""
     if len(values) < min_samples:
         return None, None, None
     if len(values) < 3:
         return None, None, None
-    history = values[1:]
-    if len(history) < 2:
-        return None, None, None
-    mean = statistics.mean(history)
-    stdev = statistics.stdev(history)
-    if stdev == 0:
-        return 0.0, mean, stdev
-    return (values[0] - mean) / stdev, mean, stdev
-
-
-@dataclass(frozen=True)
-class LoggedReading:
-    timestamp: str
-    source: str
-    host: str
-    port: int
-    unit_id: int
-    kind: str
-    address: int
-    value: float
-    label: str | None
+    if _HAS_NUMPY:
+        history = np.asarray(values[1:], dtype=np.float64)
+        mean = float(history.mean())
+        stdev = float(history.std(ddof=1))
+    else:
+        mean = statistics.mean(values[1:])
+        stdev = statistics.stdev(values[1:])
+    # NumPy's two-pass std leaves rounding noise (~1e-17) on constant
+    # non-integer series where statistics.stdev returns exactly 0.
+    if stdev <= 1e-12 * max(1.0, abs(mean)):
+        return 0.0, mean, 0.0
+    return (float(values[0]) - mean) / stdev, mean, stdev
 
 
 class SQLiteDataLogger:
-    def __init__(self, db_path: Path, kinds: Iterable[str], enabled: bool) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        kinds: Iterable[str],
+        enabled: bool,
+        *,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+        max_delay_ms: int = _DEFAULT_MAX_DELAY_MS,
+        cache_ttl_ms: int = _DEFAULT_CACHE_TTL_MS,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+    ) -> None:
         self.db_path = db_path
         self.kinds = {kind for kind in kinds if kind in _ALLOWED_KINDS}
         self.enabled = enabled
-        self._initialized = False
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max(0, max_delay_ms) / 1000
+        self.cache_ttl = max(0, cache_ttl_ms) / 1000
+        self.max_queue = max(1, max_queue)
+        # Readings rejected since the backlog last went over max_queue.
+        self._dropped = 0
+        # (host, port, unit_id, kind, address) -> (limit, oldest_first)
+        #   -> (expiry, values)
+        self._recent_cache: dict[
+            _SeriesKey, dict[tuple[int, bool], tuple[float, list[float]]]
+        ] = {}
+        self._queue: asyncio.Queue[LoggedReading] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._inflight: list[LoggedReading] = []
+        # Set by flush() to skip the writer's coalescing delay.
+        self._wake = asyncio.Event()
+        # Set once the schema exists and self._conn is open; checked lock-free
+        # on every read/write, the lock only guards the one-time setup.
+        self._init_done = threading.Event()
         self._init_lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
 
     async def log_readings(
         self,
@@ -103,6 +249,7 @@ class SQLiteDataLogger:
         if not readings:
             return
         timestamp = timestamp or utc_now_iso()
+        host, port, unit_id = connection.host, connection.port, connection.unit_id
         records: list[LoggedReading] = []
         for reading in readings:
             kind = reading.get("kind")
@@ -111,26 +258,114 @@ class SQLiteDataLogger:
             base_address = int(reading.get("address", 0))
             label = reading.get("label")
             values = reading.get("values") or []
+            for offset in range(len(values)):
+                self._recent_cache.pop(
+                    (host, port, unit_id, kind, base_address + offset), None
+                )
+            # Bits are stored as 0/1; the REAL column affinity handles the rest.
+            convert: Callable[[Any], float] = int if kind in _BIT_KINDS else float
             for offset, value in enumerate(values):
                 records.append(
-                    LoggedReading(
-                        timestamp=timestamp,
-                        source=source,
-                        host=connection.host,
-                        port=connection.port,
-                        unit_id=connection.unit_id,
-                        kind=kind,
-                        address=base_address + offset,
-                        value=float(value),
-                        label=label,
+                    (
+                        timestamp,
+                        source,
+                        host,
+                        port,
+                        unit_id,
+                        kind,
+                        base_address + offset,
+                        convert(value),
+                        label,
                     )
                 )
         if not records:
             return
-        try:
-            await asyncio.to_thread(self._write_records, records)
-        except Exception as exc:  # noqa: BLE001 - logging should never break flow
-            logger.warning("Data logger failed: %s", exc)
+        queue = self._ensure_writer()
+        # Callers sit on the polling path: shed load instead of growing the
+        # backlog without bound when the disk cannot keep up.
+        if queue.qsize() + len(records) > self.max_queue:
+            if not self._dropped:
+                logger.warning(
+                    "Data logger backlog above %d readings; dropping new readings",
+                    self.max_queue,
+                )
+            self._dropped += len(records)
+            return
+        if self._dropped:
+            logger.warning(
+                "Data logger caught up after dropping %d readings", self._dropped
+            )
+            self._dropped = 0
+        for record in records:
+            queue.put_nowait(record)
+
+    async def flush(self) -> None:
+        """Wait until every queued reading has been written.
+
+        The background writer stays the only one writing, so rows keep their
+        arrival order (and ``id`` order); flushing just cuts its coalescing
+        delay short.
+        """
+        queue = self._queue
+        task = self._writer_task
+        if queue is None or task is None or task.done():
+            return
+        if task.get_loop() is not _running_loop():
+            return
+        self._wake.set()
+        await queue.join()
+
+    def _ensure_writer(self) -> asyncio.Queue[LoggedReading]:
+        """Return the queue fed to the background writer of the running loop."""
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        queue = self._queue
+        if queue is not None and task is not None and not task.done():
+            if task.get_loop() is loop:
+                return queue
+        # First use, or the previous loop went away (e.g. a new TestClient):
+        # stop the old writer and carry over anything it had not written yet,
+        # including a batch it was still holding while coalescing.
+        if task is not None:
+            _cancel_task(task)
+        carried = self._inflight
+        self._inflight = []
+        if queue is not None:
+            carried.extend(_drain(queue))
+        self._queue = asyncio.Queue()
+        self._wake = asyncio.Event()
+        for record in carried:
+            self._queue.put_nowait(record)
+        self._writer_task = loop.create_task(self._writer_loop(self._queue))
+        return self._queue
+
+    async def _writer_loop(self, queue: asyncio.Queue[LoggedReading]) -> None:
+        wake = self._wake
+        while True:
+            if queue.empty():
+                wake.clear()
+            # Records held here while coalescing are picked up by close().
+            batch = self._inflight = [await queue.get()]
+            if (
+                self.max_delay
+                and not wake.is_set()
+                and queue.qsize() < self.max_batch - 1
+            ):
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wake.wait(), self.max_delay)
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._inflight = []
+            try:
+                await asyncio.to_thread(self._write_records, batch)
+            except Exception as exc:  # noqa: BLE001 - logging should never break flow
+                logger.warning("Data logger failed: %s", exc)
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
     async def fetch_recent_values(
         self,
@@ -142,8 +377,19 @@ class SQLiteDataLogger:
     ) -> list[float]:
         if not self.enabled:
             return []
+        series: _SeriesKey = (
+            connection.host,
+            connection.port,
+            connection.unit_id,
+            kind,
+            address,
+        )
+        cached = self._recent_cache.get(series, {}).get((limit, False))
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+        await self.flush()
         try:
-            return await asyncio.to_thread(
+            values = await asyncio.to_thread(
                 self._fetch_recent_values_sync,
                 connection,
                 kind,
@@ -153,14 +399,117 @@ class SQLiteDataLogger:
         except Exception as exc:  # noqa: BLE001 - treat logging issues as non-fatal
             logger.warning("Data logger query failed: %s", exc)
             return []
+        if self.cache_ttl > 0:
+            expiry = time.monotonic() + self.cache_ttl
+            self._recent_cache.setdefault(series, {})[(limit, False)] = (
+                expiry,
+                values,
+            )
+            return list(values)
+        return values
 
-    def _ensure_initialized(self) -> None:
+    async def fetch_recent_values_range(
+        self,
+        connection: ConnectionSettings,
+        *,
+        kind: str,
+        base_address: int,
+        count: int,
+        limit: int,
+        oldest_first: bool = False,
+    ) -> dict[int, list[float]]:
+        """Return the latest ``limit`` values for each address in a block.
+
+        Values are newest first unless ``oldest_first`` is set, in which case
+        the same window comes back in chronological order.
+        """
+        addresses = range(base_address, base_address + count)
+        if not self.enabled:
+            return {address: [] for address in addresses}
+        now = time.monotonic()
+        result: dict[int, list[float]] = {}
+        for address in addresses:
+            cached = self._recent_cache.get(
+                (connection.host, connection.port, connection.unit_id, kind, address),
+                {},
+            ).get((limit, oldest_first))
+            if cached is None or cached[0] <= now:
+                break
+            result[address] = list(cached[1])
+        else:
+            return result
+        await self.flush()
+        try:
+            rows = await asyncio.to_thread(
+                self._fetch_recent_values_range_sync,
+                connection,
+                kind,
+                base_address,
+                count,
+                limit,
+                oldest_first,
+            )
+        except Exception as exc:  # noqa: BLE001 - treat logging issues as non-fatal
+            logger.warning("Data logger query failed: %s", exc)
+            return {address: [] for address in addresses}
+        expiry = time.monotonic() + self.cache_ttl
+        for address in addresses:
+            values = rows.get(address, [])
+            result[address] = values
+            if self.cache_ttl > 0:
+                self._recent_cache.setdefault(
+                    (
+                        connection.host,
+                        connection.port,
+                        connection.unit_id,
+                        kind,
+                        address,
+                    ),
+                    {},
+                )[(limit, oldest_first)] = (expiry, list(values))
+        return result
+
+    def close(self) -> None:
+        """Write queued readings, then close the persistent connection.
+
+        The connection is reopened lazily if the logger is used again.
+        """
+        task = self._writer_task
+        if task is not None:
+            _cancel_task(task)
+        self._writer_task = None
+        pending = self._inflight
+        if self._queue is not None:
+            pending.extend(_drain(self._queue))
+        self._inflight = []
+        self._queue = None
+        if pending:
+            try:
+                self._write_records(pending)
+            except Exception as exc:  # noqa: BLE001 - logging should never break flow
+                logger.warning("Data logger failed: %s", exc)
+        with self._init_lock:
+            with self._write_lock:
+                self._init_done.clear()
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+    def _ensure_initialized(self) -> sqlite3.Connection:
+        conn = self._conn
+        if conn is not None and self._init_done.is_set():
+            return conn
         with self._init_lock:
-            if self._initialized:
-                return
+            if self._conn is not None and self._init_done.is_set():
+                return self._conn
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
+            # Autocommit mode: transactions are opened explicitly by the writer.
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
             try:
+                for pragma in _CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS readings (
@@ -177,45 +526,36 @@ class SQLiteDataLogger:
                     )
                     """
                 )
+                # Rows are appended in time order, so the integer primary key
+                # gives recency without sorting ISO timestamp strings.
+                conn.execute("DROP INDEX IF EXISTS idx_readings_series")
                 conn.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_readings_series
-                    ON readings (host, port, unit_id, kind, address, timestamp)
+                    CREATE INDEX IF NOT EXISTS idx_readings_series_recent
+                    ON readings (host, port, unit_id, kind, address, id)
                     """
                 )
-                conn.commit()
-            finally:
+            except Exception:
                 conn.close()
-            self._initialized = True
+                raise
+            self._conn = conn
+            self._init_done.set()
+            return conn
 
     def _write_records(self, records: Sequence[LoggedReading]) -> None:
-        self._ensure_initialized()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.executemany(
-                """
-                INSERT INTO readings (
-                    timestamp, source, host, port, unit_id, kind, address, value, label
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        record.timestamp,
-                        record.source,
-                        record.host,
-                        record.port,
-                        record.unit_id,
-                        record.kind,
-                        record.address,
-                        record.value,
-                        record.label,
+        conn = self._ensure_initialized()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for start in range(0, len(records), _MAX_ROWS_PER_INSERT):
+                    chunk = records[start : start + _MAX_ROWS_PER_INSERT]
+                    conn.execute(
+                        _insert_sql(len(chunk)), list(chain.from_iterable(chunk))
                     )
-                    for record in records
-                ],
-            )
-            conn.commit()
-        finally:
-            conn.close()
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _fetch_recent_values_sync(
         self,
@@ -224,17 +564,10 @@ class SQLiteDataLogger:
         address: int,
         limit: int,
     ) -> list[float]:
-        self._ensure_initialized()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
-                """
-                SELECT value
-                FROM readings
-                WHERE host = ? AND port = ? AND unit_id = ? AND kind = ? AND address = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
+        conn = self._ensure_initialized()
+        with self._write_lock:
+            rows = conn.execute(
+                _SELECT_RECENT_SQL,
                 (
                     connection.host,
                     connection.port,
@@ -243,21 +576,67 @@ class SQLiteDataLogger:
                     address,
                     limit,
                 ),
-            )
-            rows = cursor.fetchall()
-            return [float(row[0]) for row in rows]
-        finally:
-            conn.close()
+            ).fetchall()
+        return [float(row[0]) for row in rows]
+
+    def _fetch_recent_values_range_sync(
+        self,
+        connection: ConnectionSettings,
+        kind: str,
+        base_address: int,
+        count: int,
+        limit: int,
+        oldest_first: bool,
+    ) -> dict[int, list[float]]:
+        conn = self._ensure_initialized()
+        with self._write_lock:
+            rows = conn.execute(
+                _recent_range_sql(count, oldest_first),
+                (
+                    connection.host,
+                    connection.port,
+                    connection.unit_id,
+                    kind,
+                    limit,
+                    *range(base_address, base_address + count),
+                ),
+            ).fetchall()
+        grouped: dict[int, list[float]] = {}
+        for address, value in rows:
+            grouped.setdefault(int(address), []).append(float(value))
+        return grouped
 
 
 _DATA_LOGGER: SQLiteDataLogger | None = None
+# Loggers replaced by reset_data_logger() that a monitor session may still use.
+_RETIRED_LOGGERS: set[SQLiteDataLogger] = set()
 
 
 def _build_data_logger() -> SQLiteDataLogger:
     enabled = _parse_bool(os.getenv("MODBUS_WEB_MONITOR_LOG_ENABLED"), True)
     kinds = _parse_kinds(os.getenv("MODBUS_WEB_MONITOR_LOG_KINDS"))
+    max_batch = _parse_int(
+        os.getenv("MODBUS_WEB_MONITOR_LOG_MAX_BATCH"), _DEFAULT_MAX_BATCH
+    )
+    max_delay_ms = _parse_int(
+        os.getenv("MODBUS_WEB_MONITOR_LOG_MAX_DELAY_MS"), _DEFAULT_MAX_DELAY_MS
+    )
+    cache_ttl_ms = _parse_int(
+        os.getenv("MODBUS_WEB_MONITOR_LOG_CACHE_TTL_MS"), _DEFAULT_CACHE_TTL_MS
+    )
+    max_queue = _parse_int(
+        os.getenv("MODBUS_WEB_MONITOR_LOG_MAX_QUEUE"), _DEFAULT_MAX_QUEUE
+    )
     db_path = _resolve_db_path()
-    return SQLiteDataLogger(db_path=db_path, kinds=kinds, enabled=enabled)
+    return SQLiteDataLogger(
+        db_path=db_path,
+        kinds=kinds,
+        enabled=enabled,
+        max_batch=max_batch,
+        max_delay_ms=max_delay_ms,
+        cache_ttl_ms=cache_ttl_ms,
+        max_queue=max_queue,
+    )
 
 
 def get_data_logger() -> SQLiteDataLogger:
@@ -267,7 +646,38 @@ def get_data_logger() -> SQLiteDataLogger:
     return _DATA_LOGGER
 
 
+async def shutdown_data_logger() -> None:
+    """Flush and close the active logger and any still held by a session."""
+    loggers = list(_RETIRED_LOGGERS)
+    _RETIRED_LOGGERS.clear()
+    if _DATA_LOGGER is not None:
+        loggers.append(_DATA_LOGGER)
+    for data_logger in loggers:
+        await _close_data_logger(data_logger)
+
+
 def reset_data_logger() -> SQLiteDataLogger:
+    """Start a new logger (and database file) for a monitor session.
+
+    The previous logger is left open: the session that started it may still be
+    writing. It is closed by :func:`release_data_logger` or at shutdown.
+    """
     global _DATA_LOGGER
+    if _DATA_LOGGER is not None:
+        _RETIRED_LOGGERS.add(_DATA_LOGGER)
     _DATA_LOGGER = _build_data_logger()
     return _DATA_LOGGER
+
+
+async def release_data_logger(data_logger: SQLiteDataLogger) -> None:
+    """Close a session's logger once it ends, unless it is still the active one."""
+    if data_logger is _DATA_LOGGER:
+        return
+    _RETIRED_LOGGERS.discard(data_logger)
+    await _close_data_logger(data_logger)
+
+
+async def _close_data_logger(data_logger: SQLiteDataLogger) -> None:
+    # Let the writer finish, then close the connection off the event loop.
+    await data_logger.flush()
+    await asyncio.to_thread(data_logger.close)
@@ -3,8 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import os
+import socket
+import weakref
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, List, Sequence, TypeAlias, cast
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Sequence,
+    TypeAlias,
+    cast,
+)
 
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
@@ -16,6 +30,22 @@ from pymodbus.pdu.register_message import (
 
 from .schemas import ConnectionSettings, ReadTarget, WriteOperation
 
+logger = logging.getLogger(__name__)
+
+# Seconds an unused pooled connection stays open before it is closed.
+_POOL_IDLE_TIMEOUT = float(os.getenv("MODBUS_WEB_MONITOR_POOL_IDLE_TIMEOUT", "30"))
+# Seconds between probe reads on an idle pooled connection (0 disables).
+_POOL_KEEPALIVE = float(os.getenv("MODBUS_WEB_MONITOR_POOL_KEEPALIVE", "0"))
+# What the probe reads; kind "none" only checks that the socket is still open.
+_POOL_KEEPALIVE_KIND = os.getenv("MODBUS_WEB_MONITOR_POOL_KEEPALIVE_KIND", "coil")
+_POOL_KEEPALIVE_ADDRESS = int(
+    os.getenv("MODBUS_WEB_MONITOR_POOL_KEEPALIVE_ADDRESS", "0")
+)
+# TCP connections opened per session so several reads can be in flight at once.
+# Off (1) by default: many devices accept only one or a few Modbus TCP clients
+# and may drop existing ones when more connect, so this is opt-in.
+_READ_CONNECTIONS = max(1, int(os.getenv("MODBUS_WEB_MONITOR_READ_CONNECTIONS", "1")))
+
 
 class ModbusConnectionError(Exception):
     """Raised when a connection cannot be established."""
@@ -25,14 +55,6 @@ class ModbusOperationError(Exception):
     """Raised when a read/write operation fails."""
 
 
-def _is_connected(client: AsyncModbusTcpClient) -> bool:
-    connected = getattr(client, "connected", False)
-    if connected:
-        return True
-    protocol = getattr(client, "protocol", None)
-    return protocol is not None and getattr(protocol, "transport", None) is not None
-
-
 ModbusReadResponse: TypeAlias = (
     ReadHoldingRegistersResponse
     | ReadInputRegistersResponse
@@ -47,16 +69,71 @@ def _extract_values(
     if response.isError():
         raise ModbusOperationError(str(response))
 
-    data: Sequence[int | bool]
-    if hasattr(response, "registers"):
+    # pymodbus PDUs carry both attributes (bit responses have registers=[]),
+    # so pick the field by the requested kind.
+    data: List[int | bool]
+    if target_kind in ("coil", "discrete") and hasattr(response, "bits"):
+        data = cast(List[int | bool], response.bits)
+    elif hasattr(response, "registers"):
         data = response.registers
-    elif hasattr(response, "bits"):
-        data = response.bits
     else:  # pragma: no cover - defensive
         raise ModbusOperationError(f"Unexpected response for {target_kind}: {response}")
 
-    # Trim just in case the backend returns more than requested
-    return list(data[:expected])
+    # The PDU's list is only read after this, so hand it over without copying
+    # unless it needs trimming (bit responses are padded to whole bytes).
+    if len(data) > expected:
+        return data[:expected]
+    return data
+
+
+# Protocol limits for a single read request.
+_MAX_READ_COUNT = {"holding": 125, "input": 125, "coil": 2000, "discrete": 2000}
+
+
+@dataclass
+class _ReadBlock:
+    kind: str
+    address: int
+    count: int
+    members: List[int]
+
+
+def _plan_reads(targets: Sequence[ReadTarget]) -> List[_ReadBlock]:
+    """Merge overlapping or adjacent targets of the same kind into blocks."""
+    order = sorted(
+        range(len(targets)), key=lambda i: (targets[i].kind, targets[i].address)
+    )
+    blocks: List[_ReadBlock] = []
+    for index in order:
+        target = targets[index]
+        end = target.address + target.count
+        if blocks:
+            block = blocks[-1]
+            block_end = block.address + block.count
+            span = max(block_end, end) - block.address
+            if (
+                block.kind == target.kind
+                and target.address <= block_end
+                and span <= _MAX_READ_COUNT[target.kind]
+            ):
+                block.count = span
+                block.members.append(index)
+                continue
+        blocks.append(_ReadBlock(target.kind, target.address, target.count, [index]))
+    return blocks
+
+
+# Bound pymodbus request method, e.g. ``client.read_coils``.
+_RequestMethod: TypeAlias = Callable[..., Awaitable[Any]]
+
+
+def _read_methods(client: AsyncModbusTcpClient) -> dict[str, _RequestMethod]:
+    return {
+        "holding": client.read_holding_registers,
+        "input": client.read_input_registers,
+        "coil": client.read_coils,
+        "discrete": client.read_discrete_inputs,
+    }
 
 
 class ModbusTcpSession:
@@ -64,50 +141,95 @@ class ModbusTcpSession:
 
     def __init__(self, settings: ConnectionSettings):
         self.settings = settings
-        self._client = AsyncModbusTcpClient(
-            host=settings.host, port=settings.port, timeout=settings.timeout
-        )
-        self._lock = asyncio.Lock()
+        # pymodbus serializes transactions per client, so concurrency comes
+        # from extra connections rather than from overlapping requests.
+        self._clients = [
+            AsyncModbusTcpClient(
+                host=settings.host, port=settings.port, timeout=settings.timeout
+            )
+            for _ in range(_READ_CONNECTIONS)
+        ]
+        self._client = self._clients[0]
+        # Free connections, each as its kind -> read method table.
+        self._idle: asyncio.Queue[dict[str, _RequestMethod]] = asyncio.Queue()
+        for client in self._clients:
+            self._idle.put_nowait(_read_methods(client))
+        # (kind, several values) -> write method of the primary connection.
+        self._writers: dict[tuple[str, bool], _RequestMethod] = {
+            ("holding", False): self._client.write_register,
+            ("holding", True): self._client.write_registers,
+            ("coil", False): self._client.write_coil,
+            ("coil", True): self._client.write_coils,
+        }
 
     async def connect(self) -> None:
-        await self._client.connect()
-        if not _is_connected(self._client):
+        await asyncio.gather(*(client.connect() for client in self._clients))
+        if not self.connected:
             raise ModbusConnectionError(
                 f"Could not connect to {self.settings.host}:{self.settings.port}"
             )
+        for client in self._clients:
+            _enable_tcp_keepalive(client)
+
+    @property
+    def connected(self) -> bool:
+        return all(client.connected for client in self._clients)
 
     async def close(self) -> None:
+        self.close_nowait()
+
+    def close_nowait(self) -> None:
         # pymodbus async client close() is synchronous; don't await.
-        self._client.close()
+        for client in self._clients:
+            client.close()
 
     async def read(
         self, target: ReadTarget, unit_id: int | None = None
     ) -> List[int | bool]:
         """Read a register/coil."""
         device_id = unit_id if unit_id is not None else self.settings.unit_id
-        async with self._lock:
-            try:
-                if target.kind == "holding":
-                    response = await self._client.read_holding_registers(
-                        target.address, count=target.count, device_id=device_id
-                    )
-                elif target.kind == "input":
-                    response = await self._client.read_input_registers(
-                        target.address, count=target.count, device_id=device_id
-                    )
-                elif target.kind == "coil":
-                    response = await self._client.read_coils(
-                        target.address, count=target.count, device_id=device_id
-                    )
-                else:
-                    response = await self._client.read_discrete_inputs(
-                        target.address, count=target.count, device_id=device_id
-                    )
-            except ModbusException as exc:
-                raise ModbusOperationError(str(exc)) from exc
+        return await self._read_block(
+            target.kind, target.address, target.count, device_id
+        )
+
+    async def read_many(
+        self, targets: Sequence[ReadTarget], unit_id: int | None = None
+    ) -> List[List[int | bool]]:
+        """Read several targets, merging contiguous ones into single requests.
+
+        Values are returned in the same order as ``targets``.
+        """
+        device_id = unit_id if unit_id is not None else self.settings.unit_id
+        blocks = _plan_reads(targets)
+        block_values = await asyncio.gather(
+            *(
+                self._read_block(block.kind, block.address, block.count, device_id)
+                for block in blocks
+            )
+        )
+        results: List[List[int | bool]] = [[] for _ in targets]
+        for block, values in zip(blocks, block_values):
+            for index in block.members:
+                target = targets[index]
+                start = target.address - block.address
+                results[index] = values[start : start + target.count]
+        return results
+
+    async def _read_block(
+        self, kind: str, address: int, count: int, device_id: int
+    ) -> List[int | bool]:
+        # Borrow whichever connection is free; with one connection this
+        # simply queues reads behind each other.
+        readers = await self._idle.get()
+        try:
+            response = await readers[kind](address, count=count, device_id=device_id)
+        except ModbusException as exc:
+            raise ModbusOperationError(str(exc)) from exc
+        finally:
+            self._idle.put_nowait(readers)
 
         typed_response = cast(ModbusReadResponse, response)
-        return _extract_values(typed_response, target.count, target.kind)
+        return _extract_values(typed_response, count, kind)
 
     async def write(
         self, operation: WriteOperation, unit_id: int | None = None
@@ -115,43 +237,188 @@ class ModbusTcpSession:
         """Write a register or coil value."""
         device_id = unit_id if unit_id is not None else self.settings.unit_id
         value = operation.value
-        async with self._lock:
-            try:
-                if operation.kind == "holding":
-                    if isinstance(value, list):
-                        int_values = [int(v) for v in value]
-                        response = await self._client.write_registers(
-                            operation.address, int_values, device_id=device_id
-                        )
-                    else:
-                        response = await self._client.write_register(
-                            operation.address, int(value), device_id=device_id
-                        )
-                else:
-                    # coil
-                    if isinstance(value, list):
-                        bool_values = [bool(v) for v in value]
-                        response = await self._client.write_coils(
-                            operation.address, bool_values, device_id=device_id
-                        )
-                    else:
-                        response = await self._client.write_coil(
-                            operation.address, bool(value), device_id=device_id
-                        )
-            except ModbusException as exc:
-                raise ModbusOperationError(str(exc)) from exc
+        convert: Callable[[Any], int | bool] = (
+            int if operation.kind == "holding" else bool
+        )
+        payload: int | bool | List[int | bool]
+        if isinstance(value, list):
+            payload = [convert(v) for v in value]
+        else:
+            payload = convert(value)
+        # Writes always use the primary connection so they stay ordered. There
+        # is no session lock: a read borrowed on that same connection may run
+        # concurrently, which is safe only because pymodbus (3.11)
+        # TransactionManager.execute serializes requests per client with its
+        # own asyncio.Lock. Revisit this if that guarantee ever goes away.
+        write = self._writers[(operation.kind, isinstance(payload, list))]
+        try:
+            response = await write(operation.address, payload, device_id=device_id)
+        except ModbusException as exc:
+            raise ModbusOperationError(str(exc)) from exc
 
         if response.isError():
             raise ModbusOperationError(str(response))
 
 
+def _enable_tcp_keepalive(client: AsyncModbusTcpClient) -> None:
+    """Let the OS detect half-open sockets to devices that vanished."""
+    transport = client.ctx.transport
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:  # pragma: no cover - defensive
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as exc:  # pragma: no cover - platform specific
+        logger.debug("Could not enable SO_KEEPALIVE: %s", exc)
+
+
+# (host, port, unit_id, timeout)
+_PoolKey: TypeAlias = tuple[str, int, int, float]
+
+
+@dataclass
+class _PooledSession:
+    session: ModbusTcpSession
+    loop: asyncio.AbstractEventLoop
+    users: int = 0
+    idle_handle: asyncio.TimerHandle | None = None
+    keepalive_task: asyncio.Task[None] | None = None
+
+
+_POOL: dict[_PoolKey, _PooledSession] = {}
+_POOL_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_key(settings: ConnectionSettings) -> _PoolKey:
+    return (settings.host, settings.port, settings.unit_id, settings.timeout)
+
+
+def _discard(key: _PoolKey, entry: _PooledSession) -> None:
+    if _POOL.get(key) is entry:
+        del _POOL[key]
+    _stop_idle_timers(entry)
+    try:
+        entry.session.close_nowait()
+    except Exception as exc:  # noqa: BLE001 - the owning loop may be gone
+        logger.debug("Ignoring error while closing pooled session: %s", exc)
+
+
+def _stop_idle_timers(entry: _PooledSession) -> None:
+    if entry.idle_handle is not None:
+        entry.idle_handle.cancel()
+        entry.idle_handle = None
+    task = entry.keepalive_task
+    entry.keepalive_task = None
+    if task is None or task.done() or entry.loop.is_closed():
+        return
+    if task is not asyncio.current_task(entry.loop):
+        task.cancel()
+
+
+def _keepalive_target() -> ReadTarget | None:
+    """Return the one-value read used as keepalive probe, if any."""
+    if _POOL_KEEPALIVE_KIND == "none":
+        return None
+    return ReadTarget.model_validate(
+        {"kind": _POOL_KEEPALIVE_KIND, "address": _POOL_KEEPALIVE_ADDRESS}
+    )
+
+
+async def _keepalive(key: _PoolKey, entry: _PooledSession) -> None:
+    """Probe an idle connection so a dead device is dropped from the pool."""
+    session = entry.session
+    target = _keepalive_target()
+    while entry.users == 0:
+        await asyncio.sleep(_POOL_KEEPALIVE)
+        try:
+            if target is None:
+                if not session.connected:
+                    raise ModbusConnectionError("connection closed")
+                continue
+            await asyncio.wait_for(
+                session.read(target), timeout=session.settings.timeout
+            )
+        except (
+            ModbusConnectionError,
+            ModbusOperationError,
+            ModbusException,
+            OSError,
+            asyncio.TimeoutError,
+        ) as exc:
+            # An exception response still proves the link is alive.
+            if isinstance(exc, ModbusOperationError) and session.connected:
+                continue
+            logger.info("Dropping pooled Modbus connection %s: %s", key[:2], exc)
+            _discard(key, entry)
+            return
+
+
+def _reap_if_idle(key: _PoolKey, entry: _PooledSession) -> None:
+    entry.idle_handle = None
+    if entry.users == 0:
+        _discard(key, entry)
+
+
+async def _acquire(settings: ConnectionSettings) -> _PooledSession:
+    loop = asyncio.get_running_loop()
+    lock = _POOL_LOCKS.setdefault(loop, asyncio.Lock())
+    key = _pool_key(settings)
+    async with lock:
+        entry = _POOL.get(key)
+        if entry is not None and entry.loop is not loop:
+            # Transports are bound to the loop that opened them.
+            _discard(key, entry)
+            entry = None
+        if entry is None:
+            entry = _PooledSession(session=ModbusTcpSession(settings), loop=loop)
+        if not entry.session.connected:
+            try:
+                await entry.session.connect()
+            except (ModbusConnectionError, ModbusException, OSError) as exc:
+                _discard(key, entry)
+                if isinstance(exc, ModbusConnectionError):
+                    raise
+                raise ModbusConnectionError(str(exc)) from exc
+        _stop_idle_timers(entry)
+        entry.users += 1
+        _POOL[key] = entry
+        return entry
+
+
+def _release(settings: ConnectionSettings, entry: _PooledSession) -> None:
+    key = _pool_key(settings)
+    entry.users -= 1
+    if _POOL.get(key) is not entry:
+        if entry.users == 0:
+            _discard(key, entry)
+        return
+    if not entry.session.connected:
+        # Reconnect on next acquire rather than handing out a dead socket.
+        if entry.users == 0:
+            _discard(key, entry)
+        return
+    if entry.users == 0:
+        entry.idle_handle = entry.loop.call_later(
+            _POOL_IDLE_TIMEOUT, _reap_if_idle, key, entry
+        )
+        if _POOL_KEEPALIVE > 0:
+            entry.keepalive_task = entry.loop.create_task(_keepalive(key, entry))
+
+
+async def close_all_sessions() -> None:
+    """Close every pooled connection (used on application shutdown)."""
+    for key, entry in list(_POOL.items()):
+        _discard(key, entry)
+
+
 @asynccontextmanager
 async def tcp_session(settings: ConnectionSettings) -> AsyncIterator[ModbusTcpSession]:
-    """Context manager that yields a connected ModbusTcpSession."""
+    """Context manager that yields a connected, pooled ModbusTcpSession."""
 
-    session = ModbusTcpSession(settings)
-    await session.connect()
+    entry = await _acquire(settings)
     try:
-        yield session
+        yield entry.session
     finally:
-        await session.close()
+        _release(settings, entry)
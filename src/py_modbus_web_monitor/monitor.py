@@ -4,19 +4,239 @@ from __future__ import annotations
 
 import asyncio
 import json
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+import struct
+import sys
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Sequence,
+    TypeAlias,
+    cast,
+)
 
 from fastapi import WebSocket
 
-from .data_logger import reset_data_logger
+from .data_logger import release_data_logger, reset_data_logger, utc_now_iso
 from .modbus_client import (
     ModbusConnectionError,
     ModbusOperationError,
     ModbusTcpSession,
     tcp_session,
 )
-from .schemas import MonitorCommand, MonitorConfig, WriteOperation
+from .schemas import MonitorCommand, MonitorConfig, ReadTarget, WriteOperation
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+
+    _HAS_ORJSON = True
+except Exception:  # noqa: BLE001 - fall back to Starlette's stdlib encoder
+    _HAS_ORJSON = False
+try:  # pragma: no cover - optional dependency
+    from ._msgspec_schemas import CommandDecoder
+
+    _HAS_MSGSPEC = True
+except Exception:  # noqa: BLE001 - fall back to the Pydantic models
+    _HAS_MSGSPEC = False
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if _HAS_ORJSON else 0
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Keepalive probes are answered without going through schema validation.
+_PING_MESSAGES: frozenset[str | bytes] = frozenset(
+    {'{"type":"ping"}', '{"type": "ping"}', b'{"type":"ping"}', b'{"type": "ping"}'}
+)
+_PONG_MESSAGE = '{"type":"pong"}'
+
+
+def _decode_command_pydantic(raw: str | bytes) -> tuple[str, List[WriteOperation]]:
+    command = MonitorCommand.model_validate_json(raw)
+    return command.type, command.writes or []
+
+
+def _command_decoder() -> Callable[[str | bytes], tuple[str, List[WriteOperation]]]:
+    """Return a ``raw -> (command type, writes)`` decoder for open sockets."""
+    if _HAS_MSGSPEC:
+        return CommandDecoder(fallback=_decode_command_pydantic).decode
+    return _decode_command_pydantic
+
+
+def _json_frame(data: Any) -> str:
+    """Encode ``data`` as a JSON text frame, with orjson when installed."""
+    if _HAS_ORJSON:
+        # Text frames keep the browser client's JSON.parse(event.data) working.
+        payload = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+        return payload.decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+async def send_json_fast(websocket: WebSocket, data: Any) -> None:
+    """Send ``data`` as a JSON text frame, encoded with orjson when installed."""
+    await websocket.send_text(_json_frame(data))
+
+
+def _target_label(target: ReadTarget) -> str:
+    return target.label or f"{target.kind}:{target.address}"
+
+
+def _update_frame_encoder(
+    targets: Sequence[ReadTarget],
+) -> Callable[[str, Sequence[List[int | bool]]], str]:
+    """Return a ``(timestamp, values) -> text`` encoder for "update" frames.
+
+    Targets are fixed for the session, so their address/kind/label fields are
+    encoded once and only the timestamp and values are serialized per tick.
+    """
+    if not _HAS_ORJSON:
+
+        def encode_json(timestamp: str, values: Sequence[List[int | bool]]) -> str:
+            data = [
+                {
+                    "address": target.address,
+                    "kind": target.kind,
+                    "label": _target_label(target),
+                    "values": target_values,
+                }
+                for target, target_values in zip(targets, values)
+            ]
+            return json.dumps({"type": "update", "timestamp": timestamp, "data": data})
+
+        return encode_json
+
+    prefixes = [
+        orjson.dumps(
+            {
+                "address": target.address,
+                "kind": target.kind,
+                "label": _target_label(target),
+            }
+        )[:-1]
+        + b',"values":'
+        for target in targets
+    ]
+    dumps = orjson.dumps
+
+    def encode(timestamp: str, values: Sequence[List[int | bool]]) -> str:
+        data = b"},".join(
+            prefix + dumps(target_values)
+            for prefix, target_values in zip(prefixes, values)
+        )
+        return b"".join(
+            (
+                b'{"type":"update","timestamp":',
+                dumps(timestamp),
+                b',"data":[',
+                data,
+                b"}]}" if data else b"]}",
+            )
+        ).decode()
+
+    return encode
+
+
+# Binary update frames: 4-byte big-endian header length, a JSON header, then
+# each target's values in order (uint16 big-endian registers, LSB-first bits).
+_FRAME_HEADER_LEN = struct.Struct(">I")
+_BIT_KINDS = frozenset({"coil", "discrete"})
+
+
+# Also matches 0/1, which hash and compare equal to False/True.
+_BIT_CHARS: dict[int | bool, str] = {False: "0", True: "1"}
+
+
+def _pack_bits(values: Sequence[int | bool]) -> bytes:
+    # Build the bitmap as one big integer (first value = least significant
+    # bit) so the packing runs in C rather than a per-bit Python loop.
+    bitmap = "".join(map(_BIT_CHARS.__getitem__, reversed(values)))
+    return int(bitmap or "0", 2).to_bytes((len(values) + 7) // 8, "little")
+
+
+def _pack_registers(values: Sequence[int | bool]) -> bytes:
+    return struct.pack(f">{len(values)}H", *values)
+
+
+def _binary_frame_encoder(
+    targets: Sequence[ReadTarget],
+) -> Callable[[str, Sequence[List[int | bool]]], bytes]:
+    """Return a ``(timestamp, values) -> bytes`` encoder for binary frames."""
+    layout = json.dumps(
+        [
+            {
+                "address": target.address,
+                "kind": target.kind,
+                "label": _target_label(target),
+                "count": target.count,
+            }
+            for target in targets
+        ],
+        separators=(",", ":"),
+    )
+    header_prefix = f'{{"type":"update","targets":{layout},"timestamp":'.encode()
+    packers = [
+        _pack_bits if target.kind in _BIT_KINDS else _pack_registers
+        for target in targets
+    ]
+
+    def encode(timestamp: str, values: Sequence[List[int | bool]]) -> bytes:
+        header = header_prefix + json.dumps(timestamp).encode() + b"}"
+        return b"".join(
+            (
+                _FRAME_HEADER_LEN.pack(len(header)),
+                header,
+                *(pack(target_values) for pack, target_values in zip(packers, values)),
+            )
+        )
+
+    return encode
+
+
+# Frames waiting for a slow client. Past this many, the oldest update frame is
+# dropped; status, error and reply frames are always delivered, in order.
+_FRAME_QUEUE_SIZE = 32
+
+# (frame, droppable); a ``None`` frame stops the writer.
+_QueuedFrame: TypeAlias = tuple[str | bytes | None, bool]
+_FrameQueue: TypeAlias = asyncio.Queue[_QueuedFrame]
+
+
+def _offer_frame(
+    frames: _FrameQueue, frame: str | bytes | None, *, droppable: bool = False
+) -> None:
+    """Queue a frame without blocking, discarding the oldest update if full."""
+    if frames.qsize() >= _FRAME_QUEUE_SIZE:
+        pending = [frames.get_nowait() for _ in range(frames.qsize())]
+        for index, (_, can_drop) in enumerate(pending):
+            if can_drop:
+                del pending[index]
+                break
+        for item in pending:
+            frames.put_nowait(item)
+    frames.put_nowait((frame, droppable))
+
+
+async def _write_frames(websocket: WebSocket, frames: _FrameQueue) -> None:
+    """Send queued frames until the ``None`` sentinel arrives.
+
+    This is the only task that sends on the socket while a session runs.
+    """
+    while True:
+        frame, _ = await frames.get()
+        if frame is None:
+            return
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
 
 
 async def _poll_registers(
@@ -25,123 +245,187 @@ async def _poll_registers(
     config: MonitorConfig,
     stop_event: asyncio.Event,
     data_logger,
+    frames: _FrameQueue,
 ) -> None:
-    """Poll configured registers and stream updates."""
-    await websocket.send_json(
-        {
-            "type": "status",
-            "message": f"Monitoring {len(config.targets)} target(s) every {config.interval}s",
-        }
+    """Poll configured registers and queue update frames for the writer."""
+    _offer_frame(
+        frames,
+        _json_frame(
+            {
+                "type": "status",
+                "message": f"Monitoring {len(config.targets)} target(s) every {config.interval}s",
+            }
+        ),
     )
-    while not stop_event.is_set():
-        payload: List[Dict[str, Any]] = []
-        try:
-            for target in config.targets:
-                values = await session.read(target)
-                payload.append(
-                    {
-                        "address": target.address,
-                        "kind": target.kind,
-                        "label": target.label or f"{target.kind}:{target.address}",
-                        "values": values,
-                    }
+    encode: Callable[[str, Sequence[List[int | bool]]], str | bytes]
+    if config.encoding == "binary":
+        encode = _binary_frame_encoder(config.targets)
+    else:
+        encode = _update_frame_encoder(config.targets)
+    loop = asyncio.get_running_loop()
+    # One waiter for the whole session instead of a wait_for() task per tick.
+    stop_waiter = asyncio.ensure_future(stop_event.wait())
+    next_tick = loop.time()
+    try:
+        while not stop_event.is_set():
+            payload: List[Dict[str, Any]] = []
+            try:
+                # Contiguous targets share one Modbus request per tick.
+                target_values = await session.read_many(config.targets)
+                for target, values in zip(config.targets, target_values):
+                    payload.append(
+                        {
+                            "address": target.address,
+                            "kind": target.kind,
+                            "label": _target_label(target),
+                            "values": values,
+                        }
+                    )
+            except ModbusOperationError as exc:
+                _offer_frame(
+                    frames, _json_frame({"type": "error", "message": str(exc)})
                 )
-        except ModbusOperationError as exc:
-            await websocket.send_json({"type": "error", "message": str(exc)})
-        else:
-            timestamp = datetime.now(timezone.utc).isoformat()
-            await data_logger.log_readings(
-                config.connection,
-                payload,
-                source="monitor",
-                timestamp=timestamp,
-            )
-            await websocket.send_json(
-                {
-                    "type": "update",
-                    "timestamp": timestamp,
-                    "data": payload,
-                }
-            )
+            else:
+                timestamp = utc_now_iso()
+                await data_logger.log_readings(
+                    config.connection,
+                    payload,
+                    source="monitor",
+                    timestamp=timestamp,
+                )
+                # A slow client must not pace the Modbus polling.
+                _offer_frame(frames, encode(timestamp, target_values), droppable=True)
+
+            # Schedule against absolute ticks so read time doesn't add drift.
+            next_tick += config.interval
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.wait({stop_waiter}, timeout=delay)
+            else:
+                # Fell behind (slow device): resync rather than burst.
+                next_tick = loop.time()
+    finally:
+        stop_waiter.cancel()
+        _offer_frame(frames, None)
 
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=config.interval)
-        except asyncio.TimeoutError:
-            continue
+
+async def _iter_frames(websocket: WebSocket) -> AsyncIterator[str | bytes]:
+    """Yield inbound frames until disconnect; binary frames stay undecoded."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        text = message.get("text")
+        yield text if text is not None else message.get("bytes") or b""
 
 
 async def _handle_commands(
     websocket: WebSocket,
     session: ModbusTcpSession,
     stop_event: asyncio.Event,
+    frames: _FrameQueue,
 ) -> None:
     """Handle write/ping commands from the websocket client."""
-    async for raw in websocket.iter_text():
+    decode = _command_decoder()
+    async for raw in _iter_frames(websocket):
+        if raw in _PING_MESSAGES:
+            _offer_frame(frames, _PONG_MESSAGE)
+            continue
         try:
-            data = json.loads(raw)
-            command = MonitorCommand.model_validate(data)
+            command_type, writes = decode(raw)
         except Exception as exc:  # noqa: BLE001 - keep websocket alive
-            await websocket.send_json(
-                {"type": "error", "message": f"Invalid payload: {exc}"}
+            _offer_frame(
+                frames,
+                _json_frame({"type": "error", "message": f"Invalid payload: {exc}"}),
             )
             continue
 
-        if command.type == "ping":
-            await websocket.send_json({"type": "pong"})
+        if command_type == "ping":
+            _offer_frame(frames, _json_frame({"type": "pong"}))
             continue
 
-        if command.type == "configure":
-            await websocket.send_json(
-                {
-                    "type": "error",
-                    "message": "Reconfiguration is not supported on an open socket. Reconnect instead.",
-                }
+        if command_type == "configure":
+            _offer_frame(
+                frames,
+                _json_frame(
+                    {
+                        "type": "error",
+                        "message": "Reconfiguration is not supported on an open socket. Reconnect instead.",
+                    }
+                ),
             )
             continue
 
-        if command.type == "write":
-            await _perform_writes(websocket, session, command.writes or [])
+        if command_type == "write":
+            await _perform_writes(frames, session, writes)
             continue
 
     stop_event.set()
 
 
 async def _perform_writes(
-    websocket: WebSocket, session: ModbusTcpSession, writes: List[WriteOperation]
+    frames: _FrameQueue, session: ModbusTcpSession, writes: List[WriteOperation]
 ) -> None:
     for op in writes:
         try:
             await session.write(op)
         except ModbusOperationError as exc:
-            await websocket.send_json({"type": "error", "message": str(exc)})
+            _offer_frame(frames, _json_frame({"type": "error", "message": str(exc)}))
             return
-    await websocket.send_json({"type": "ack", "message": "write complete"})
+    _offer_frame(frames, _json_frame({"type": "ack", "message": "write complete"}))
+
+
+async def _run_together(*coros: Coroutine[Any, Any, None]) -> None:
+    """Run coroutines until all finish or one fails, cancelling the others."""
+    if sys.version_info >= (3, 11):
+        try:
+            async with asyncio.TaskGroup() as group:
+                for coro in coros:
+                    group.create_task(coro)
+        except BaseExceptionGroup as errors:  # noqa: F821 - builtin on 3.11+
+            # Re-raise the original error so callers can match on its type.
+            raise errors.exceptions[0] from errors
+        return
+
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    for task in tasks:
+        # Retrieve every outcome so cancelled siblings are never reported as
+        # "Task exception was never retrieved".
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            raise cast(BaseException, task.exception())
 
 
 async def run_monitor_session(websocket: WebSocket, config: MonitorConfig) -> None:
     """Spin up the Modbus session and coordinate polling + commands."""
     try:
         data_logger = reset_data_logger()
-        async with tcp_session(config.connection) as session:
-            stop_event = asyncio.Event()
-            poll_task = asyncio.create_task(
-                _poll_registers(websocket, session, config, stop_event, data_logger)
-            )
-            command_task = asyncio.create_task(
-                _handle_commands(websocket, session, stop_event)
-            )
-            done, pending = await asyncio.wait(
-                {poll_task, command_task},
-                return_when=asyncio.FIRST_EXCEPTION,
-            )
-            stop_event.set()
-            for task in pending:
-                task.cancel()
-            for task in done:
-                exc = task.exception()
-                if exc:
-                    raise exc
+        try:
+            async with tcp_session(config.connection) as session:
+                stop_event = asyncio.Event()
+                # Unbounded: _offer_frame() caps the update frames it holds.
+                frames: _FrameQueue = asyncio.Queue()
+                try:
+                    await _run_together(
+                        _poll_registers(
+                            websocket, session, config, stop_event, data_logger, frames
+                        ),
+                        _write_frames(websocket, frames),
+                        _handle_commands(websocket, session, stop_event, frames),
+                    )
+                finally:
+                    stop_event.set()
+        finally:
+            await release_data_logger(data_logger)
     except ModbusConnectionError as exc:
-        await websocket.send_json({"type": "error", "message": str(exc)})
+        await send_json_fast(websocket, {"type": "error", "message": str(exc)})
     except Exception as exc:  # noqa: BLE001 - report unexpected errors
-        await websocket.send_json({"type": "error", "message": f"Server error: {exc}"})
+        await send_json_fast(
+            websocket, {"type": "error", "message": f"Server error: {exc}"}
+        )
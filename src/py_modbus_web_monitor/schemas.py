@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 RegisterKind = Literal["holding", "input", "coil", "discrete"]
 WriteKind = Literal["holding", "coil"]
+FrameEncoding = Literal["json", "binary"]
 
 
 class ConnectionSettings(BaseModel):
@@ -74,6 +75,7 @@ class MonitorConfig(BaseModel):
     connection: ConnectionSettings
     interval: float = Field(1.0, ge=0.005, le=60.0)
     targets: List[ReadTarget]
+    encoding: FrameEncoding = Field("json", description="Wire format for update frames")
 
 
 class MonitorCommand(BaseModel):
@@ -86,6 +88,7 @@ class MonitorCommand(BaseModel):
     interval: Optional[float] = None
     targets: Optional[List[ReadTarget]] = None
     writes: Optional[List[WriteOperation]] = None
+    encoding: FrameEncoding = "json"
 
     @model_validator(mode="after")
     def validate_command(self) -> "MonitorCommand":
@@ -0,0 +1,42 @@
+"""Numba-compiled signal kernels for the Modbus simulator."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def fill_sine(
+    out: np.ndarray,
+    index: np.ndarray,
+    phase: float,
+    offset: float,
+    amplitude: float,
+    phase_shift: float,
+    noise: float,
+) -> None:
+    """Write a clamped, noisy sine sample per register into ``out``."""
+    for i in range(out.shape[0]):
+        value = offset + amplitude * np.sin(phase + index[i] * phase_shift)
+        if noise > 0.0:
+            value += np.random.uniform(-noise, noise)
+        if value < 0.0:
+            value = 0.0
+        elif value > 65535.0:
+            value = 65535.0
+        out[i] = int(value)
+
+
+@njit(cache=True)
+def fill_ramp(out: np.ndarray, index: np.ndarray, tick: int) -> None:
+    """Write the sawtooth ``(tick + i) * 7 % 1000`` into ``out``."""
+    for i in range(out.shape[0]):
+        out[i] = (tick + index[i]) * 7 % 1000
+
+
+# Compile (or load from the on-disk cache) at import, not on the first tick.
+_warmup_index = np.arange(4, dtype=np.int64)
+fill_sine(np.empty(4, dtype=np.int64), _warmup_index, 0.0, 0.0, 1.0, 0.1, 1.0)
+fill_ramp(np.empty(4, dtype=np.int64), _warmup_index, 1)
+del _warmup_index
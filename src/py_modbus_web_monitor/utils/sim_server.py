@@ -8,8 +8,9 @@ import math
 import random
 import time
 from contextlib import suppress
-from dataclasses import dataclass, field, replace
-from typing import Any, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, Sequence
 
 from pymodbus.datastore import (
     ModbusDeviceContext,
@@ -18,10 +19,39 @@ from pymodbus.datastore import (
 )
 from pymodbus.server import StartAsyncTcpServer
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    _HAS_NUMPY = True
+except Exception:  # noqa: BLE001 - fall back to the pure-Python generators
+    _HAS_NUMPY = False
+try:  # pragma: no cover - optional dependency
+    from ._sim_numba import fill_ramp as _fill_ramp_jit
+    from ._sim_numba import fill_sine as _fill_sine_jit
+
+    _HAS_NUMBA = True
+except Exception:  # noqa: BLE001 - fall back to the NumPy generators
+    _HAS_NUMBA = False
+try:  # pragma: no cover - optional dependency
+    import uvloop
+
+    _HAS_UVLOOP = True
+except Exception:  # noqa: BLE001 - fall back to the stdlib event loop (e.g. Windows)
+    _HAS_UVLOOP = False
+
+# The ramp signal ((tick + i) * 7) % 1000 repeats every 1000 steps.
+_RAMP_LEN = 1000
+_RAMP_TABLE = [(step * 7) % _RAMP_LEN for step in range(_RAMP_LEN)]
 _SIGNAL_MODES = {"ramp", "sine", "constant"}
 _FAULT_MODES = {"drop", "spike", "drift", "stuck", "random"}
 _FAULT_KINDS = {"holding", "input", "all"}
 _OUTLIER_MODES = {"drop", "spike", "random"}
+# Concrete modes picked from when "random" is configured.
+_NON_RANDOM_FAULT_MODES = tuple(sorted(_FAULT_MODES - {"random"}))
+_NON_RANDOM_OUTLIER_MODES = tuple(sorted(_OUTLIER_MODES - {"random"}))
+# Fault/outlier kinds that touch each register bank.
+_HOLDING_KINDS = frozenset({"holding", "all"})
+_INPUT_KINDS = frozenset({"input", "all"})
 _PROFILES: dict[str, dict[str, dict[str, Any]]] = {
     "sine_drop": {
         "signal": {
@@ -123,7 +153,7 @@ class SignalSettings:
 class FaultSettings:
     enabled: bool = False
     kind: str = "input"
-    addresses: list[int] = field(default_factory=lambda: [0])
+    addresses: tuple[int, ...] = (0,)
     mode: str = "drop"
     every: float = 30.0
     duration: float = 5.0
@@ -134,7 +164,7 @@ class FaultSettings:
 class OutlierSettings:
     enabled: bool = False
     kind: str = "holding"
-    addresses: list[int] = field(default_factory=lambda: [0])
+    addresses: tuple[int, ...] = (0,)
     mode: str = "random"
     probability: float = 0.05
     magnitude: float = 300.0
@@ -150,15 +180,17 @@ class FaultRuntime:
 
 
 def _clamp_register(value: float) -> int:
-    return max(0, min(65535, int(value)))
+    # Conditional expressions instead of max()/min() builtin calls.
+    register = int(value)
+    return 0 if register < 0 else (65535 if register > 65535 else register)
 
 
-def _parse_addresses(raw: str | None, max_count: int) -> list[int]:
+def _parse_addresses(raw: str | None, max_count: int) -> tuple[int, ...]:
     if not raw:
-        return [0]
+        return (0,)
     value = raw.strip().lower()
     if value == "all":
-        return list(range(max_count))
+        return tuple(range(max_count))
     addresses: list[int] = []
     for chunk in value.split(","):
         part = chunk.strip()
@@ -175,11 +207,11 @@ def _parse_addresses(raw: str | None, max_count: int) -> list[int]:
                     addresses.extend(range(end, start + 1))
         else:
             addresses.append(int(part))
-    filtered = [addr for addr in addresses if 0 <= addr < max_count]
-    return sorted(set(filtered)) or [0]
+    filtered = {addr for addr in addresses if 0 <= addr < max_count}
+    return tuple(sorted(filtered)) or (0,)
 
 
-def _normalize_addresses(raw: str | Iterable[int], max_count: int) -> list[int]:
+def _normalize_addresses(raw: str | Iterable[int], max_count: int) -> tuple[int, ...]:
     if isinstance(raw, str):
         return _parse_addresses(raw, max_count)
     addresses: list[int] = []
@@ -190,36 +222,28 @@ def _normalize_addresses(raw: str | Iterable[int], max_count: int) -> list[int]:
             continue
         if 0 <= address < max_count:
             addresses.append(address)
-    return sorted(set(addresses)) or [0]
+    return tuple(sorted(set(addresses))) or (0,)
 
 
-def _apply_profile(
-    signal_settings: SignalSettings,
-    fault_settings: FaultSettings,
-    outlier_settings: OutlierSettings,
-    profile_name: str,
-    count: int,
-) -> tuple[SignalSettings, FaultSettings, OutlierSettings]:
+def _profile_overrides(
+    profile_name: str, count: int
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Return (signal, fault, outlier) field overrides for a preset profile."""
     profile = _PROFILES.get(profile_name)
     if not profile:
-        return signal_settings, fault_settings, outlier_settings
+        return {}, {}, {}
     signal_overrides: dict[str, Any] = dict(profile.get("signal", {}))
     fault_overrides: dict[str, Any] = dict(profile.get("fault", {}))
     outlier_overrides: dict[str, Any] = dict(profile.get("outlier", {}))
     if "addresses" in fault_overrides:
-        fault_overrides = dict(fault_overrides)
         fault_overrides["addresses"] = _normalize_addresses(
             fault_overrides["addresses"], count
         )
     if "addresses" in outlier_overrides:
-        outlier_overrides = dict(outlier_overrides)
         outlier_overrides["addresses"] = _normalize_addresses(
             outlier_overrides["addresses"], count
         )
-    signal_settings = replace(signal_settings, **signal_overrides)
-    fault_settings = replace(fault_settings, **fault_overrides)
-    outlier_settings = replace(outlier_settings, **outlier_overrides)
-    return signal_settings, fault_settings, outlier_settings
+    return signal_overrides, fault_overrides, outlier_overrides
 
 
 def _signal_values(
@@ -227,9 +251,19 @@ def _signal_values(
 ) -> list[int]:
     count = settings.count
     if mode == "ramp":
-        return [((tick + i) * 7) % 1000 for i in range(count)]
+        # Slices are fresh lists, so faults can mutate the result in place.
+        start = tick % _RAMP_LEN
+        end = start + count
+        if end <= _RAMP_LEN:
+            return _RAMP_TABLE[start:end]
+        if count <= _RAMP_LEN:
+            return _RAMP_TABLE[start:] + _RAMP_TABLE[: end - _RAMP_LEN]
+        ramp = _RAMP_TABLE[start:]
+        while len(ramp) < count:
+            ramp += _RAMP_TABLE[: count - len(ramp)]
+        return ramp
     if mode == "constant":
-        return [_clamp_register(settings.offset) for _ in range(count)]
+        return [_clamp_register(settings.offset)] * count
     if mode == "sine":
         values: list[int] = []
         for i in range(count):
@@ -240,13 +274,77 @@ def _signal_values(
             )
             values.append(_clamp_register(value))
         return values
-    return [0 for _ in range(count)]
+    return [0] * count
+
+
+@dataclass
+class _SignalBuffers:
+    """Arrays reused across ticks by the NumPy generators."""
+
+    index: np.ndarray  # arange(count)
+    registers: np.ndarray  # (2, count) holding and input values
+    scratch: np.ndarray  # float work area for the sine signal
+    rng: np.random.Generator
+
+    @classmethod
+    def allocate(cls, count: int) -> _SignalBuffers:
+        return cls(
+            index=np.arange(count, dtype=np.int64),
+            registers=np.empty((2, count), dtype=np.int64),
+            scratch=np.empty(count, dtype=np.float64),
+            rng=np.random.default_rng(),
+        )
+
+
+def _fill_signal(
+    out: np.ndarray,
+    mode: str,
+    tick: int,
+    phase: float,
+    settings: SignalSettings,
+    buffers: _SignalBuffers,
+) -> None:
+    """In-place vectorized :func:`_signal_values`."""
+    if _HAS_NUMBA and mode == "sine":
+        # Fused sine, noise and clamp in one compiled pass.
+        _fill_sine_jit(
+            out,
+            buffers.index,
+            phase,
+            settings.offset,
+            settings.amplitude,
+            settings.phase_shift,
+            settings.noise,
+        )
+    elif _HAS_NUMBA and mode == "ramp":
+        _fill_ramp_jit(out, buffers.index, tick)
+    elif mode == "ramp":
+        np.add(buffers.index, tick, out=out)
+        out *= 7
+        out %= 1000
+    elif mode == "sine":
+        values = buffers.scratch
+        np.multiply(buffers.index, settings.phase_shift, out=values)
+        values += phase
+        np.sin(values, out=values)
+        values *= settings.amplitude
+        values += settings.offset
+        if settings.noise:
+            values += buffers.rng.uniform(
+                -settings.noise, settings.noise, settings.count
+            )
+        np.clip(values, 0, 65535, out=values)
+        out[:] = values
+    elif mode == "constant":
+        out.fill(_clamp_register(settings.offset))
+    else:
+        out.fill(0)
 
 
 def _apply_faults(
     values: list[int],
     kind: str,
-    addresses: list[int],
+    addresses: tuple[int, ...],
     mode: str,
     magnitude: float,
     now: float,
@@ -287,7 +385,7 @@ def _apply_faults(
 
 def _apply_outliers(
     values: list[int],
-    addresses: list[int],
+    addresses: tuple[int, ...],
     mode: str,
     probability: float,
     magnitude: float,
@@ -302,13 +400,125 @@ def _apply_outliers(
             continue
         direction = mode
         if mode == "random":
-            direction = random.choice(sorted(_OUTLIER_MODES - {"random"}))
+            direction = random.choice(_NON_RANDOM_OUTLIER_MODES)
         if direction == "drop":
             values[address] = _clamp_register(values[address] - magnitude)
         elif direction == "spike":
             values[address] = _clamp_register(values[address] + magnitude)
 
 
+def _address_array(addresses: Iterable[int], count: int) -> np.ndarray:
+    """In-range addresses as an index array for the NumPy fault paths."""
+    return np.array([a for a in addresses if 0 <= a < count], dtype=np.intp)
+
+
+def _apply_faults_array(
+    values: np.ndarray,
+    kind: str,
+    addresses: np.ndarray,
+    mode: str,
+    magnitude: float,
+    now: float,
+    fault_start: float,
+    duration: float,
+    stuck_values: dict[tuple[str, int], int],
+) -> None:
+    """:func:`_apply_faults` on a register row; ``addresses`` are in range."""
+    if not addresses.size:
+        return
+    if mode == "stuck":
+        for address in addresses.tolist():
+            key = (kind, address)
+            if key not in stuck_values:
+                stuck_values[key] = int(values[address])
+            values[address] = stuck_values[key]
+        return
+    if mode == "drop":
+        offset = -magnitude
+    elif mode == "spike":
+        offset = magnitude
+    elif mode == "drift":
+        if duration <= 0:
+            offset = magnitude
+        else:
+            offset = magnitude * min(1.0, max(0.0, (now - fault_start) / duration))
+    else:
+        return
+    values[addresses] = np.clip(values[addresses] + offset, 0, 65535)
+
+
+def _apply_outliers_array(
+    values: np.ndarray,
+    addresses: np.ndarray,
+    mode: str,
+    probability: float,
+    magnitude: float,
+    rng: np.random.Generator,
+) -> None:
+    """:func:`_apply_outliers` on a register row with one draw per tick."""
+    if not addresses.size:
+        return
+    probability = max(0.0, min(1.0, probability))
+    hits = addresses[rng.random(addresses.size) < probability]
+    if not hits.size:
+        return
+    if mode == "random":
+        # _NON_RANDOM_OUTLIER_MODES is ("drop", "spike").
+        offsets = np.where(rng.integers(0, 2, hits.size) == 0, -magnitude, magnitude)
+    elif mode == "drop":
+        offsets = np.full(hits.size, -magnitude)
+    elif mode == "spike":
+        offsets = np.full(hits.size, magnitude)
+    else:
+        return
+    values[hits] = np.clip(values[hits] + offsets, 0, 65535)
+
+
+def _bank_setter(
+    device: ModbusDeviceContext, func_code: int, count: int
+) -> Callable[[list[Any]], object]:
+    """Return a callable that writes ``count`` values at address 0 of a bank.
+
+    Slice-assigns into the sequential block's list directly, skipping the
+    per-call decode/validation in ``setValues``; falls back to ``setValues``
+    if the datastore layout is not the expected one.
+    """
+    fallback = partial(device.setValues, func_code, 0)
+    try:
+        block = device.store[device.decode(func_code)]
+        values = block.values
+        # ModbusDeviceContext shifts addresses by one before hitting the block.
+        start = 1 - block.address
+    except (AttributeError, KeyError, TypeError):
+        return fallback
+    if not isinstance(values, list) or start < 0 or start + count > len(values):
+        return fallback
+    end = start + count
+
+    def set_bank(new_values: list[Any]) -> None:
+        values[start:end] = new_values
+
+    return set_bank
+
+
+def _active_fault_mode(
+    runtime: FaultRuntime, fault_settings: FaultSettings, now: float
+) -> str | None:
+    """Advance the fault schedule; return the mode to inject now, if any."""
+    if now >= runtime.next_at:
+        runtime.fault_start = now
+        runtime.active_until = now + fault_settings.duration
+        runtime.next_at = now + fault_settings.every
+        runtime.stuck_values.clear()
+        if fault_settings.mode == "random":
+            runtime.mode = random.choice(_NON_RANDOM_FAULT_MODES)
+        else:
+            runtime.mode = fault_settings.mode
+    if now <= runtime.active_until:
+        return runtime.mode
+    return None
+
+
 async def _update_values(
     context: ModbusServerContext,
     period: float,
@@ -319,86 +529,171 @@ async def _update_values(
     """Continuously mutate registers/coils so the UI has changing data."""
     tick = 0
     phase = 0.0
-    runtime = FaultRuntime(next_at=time.monotonic() + fault_settings.every)
+    monotonic = time.monotonic
+    runtime = FaultRuntime(next_at=monotonic() + fault_settings.every)
+    # Settings are frozen, so work out what applies once rather than per tick.
+    faults_enabled = (
+        fault_settings.enabled
+        and fault_settings.duration > 0
+        and fault_settings.every > 0
+    )
+    fault_holding = fault_settings.kind in _HOLDING_KINDS
+    fault_input = fault_settings.kind in _INPUT_KINDS
+    outlier_holding = (
+        outlier_settings.enabled and outlier_settings.kind in _HOLDING_KINDS
+    )
+    outlier_input = outlier_settings.enabled and outlier_settings.kind in _INPUT_KINDS
+    # A constant bank nothing is injected into never changes after the first
+    # write, so later ticks skip rewriting it.
+    holding_static = (
+        signal_settings.holding_signal == "constant"
+        and not (faults_enabled and fault_holding)
+        and not outlier_holding
+    )
+    input_static = (
+        signal_settings.input_signal == "constant"
+        and not (faults_enabled and fault_input)
+        and not outlier_input
+    )
+    device = context[0x00]
+    count = signal_settings.count
+    set_holding = _bank_setter(device, 3, count)
+    set_inputs = _bank_setter(device, 4, count)
+    set_coils = _bank_setter(device, 1, count)
+    set_discrete = _bank_setter(device, 2, count)
+
+    # Faults and outliers are injected into NumPy rows when available and
+    # into plain lists otherwise; the call sites below are shared.
+    apply_faults: Callable[..., None] = _apply_faults
+    apply_outliers: Callable[..., None] = _apply_outliers
+    fault_addresses: Any = fault_settings.addresses
+    outlier_addresses: Any = outlier_settings.addresses
+    if _HAS_NUMPY:
+        buffers = _SignalBuffers.allocate(count)
+        apply_faults = _apply_faults_array
+        apply_outliers = partial(_apply_outliers_array, rng=buffers.rng)
+        fault_addresses = _address_array(fault_settings.addresses, count)
+        outlier_addresses = _address_array(outlier_settings.addresses, count)
+
+    # Coils alternate along the bank and flip each tick, so the two patterns
+    # are built once and swapped by parity; the bank setters copy them.
+    even_bits = [(i & 1) == 0 for i in range(count)]
+    odd_bits = [not bit for bit in even_bits]
+
+    holding_values: Any
+    input_values: Any
+    # Ticks are scheduled against absolute deadlines so compute time does not
+    # stretch the period; if a tick overruns we resync instead of bursting.
+    deadline = monotonic()
     while True:
         tick += 1
         phase += signal_settings.phase_step
 
-        holding = _signal_values(
-            signal_settings.holding_signal, tick, phase, signal_settings
-        )
-        inputs = _signal_values(
-            signal_settings.input_signal, tick, phase, signal_settings
+        if _HAS_NUMPY:
+            holding_values, input_values = buffers.registers
+            _fill_signal(
+                holding_values,
+                signal_settings.holding_signal,
+                tick,
+                phase,
+                signal_settings,
+                buffers,
+            )
+            _fill_signal(
+                input_values,
+                signal_settings.input_signal,
+                tick,
+                phase,
+                signal_settings,
+                buffers,
+            )
+        else:
+            holding_values = _signal_values(
+                signal_settings.holding_signal, tick, phase, signal_settings
+            )
+            input_values = _signal_values(
+                signal_settings.input_signal, tick, phase, signal_settings
+            )
+
+        now = monotonic()
+        fault_mode = (
+            _active_fault_mode(runtime, fault_settings, now) if faults_enabled else None
         )
-        coils = [((tick + i) % 2) == 0 for i in range(signal_settings.count)]
-        discrete = [not c for c in coils]
-
-        now = time.monotonic()
-        if (
-            fault_settings.enabled
-            and fault_settings.duration > 0
-            and fault_settings.every > 0
-        ):
-            if now >= runtime.next_at:
-                runtime.fault_start = now
-                runtime.active_until = now + fault_settings.duration
-                runtime.next_at = now + fault_settings.every
-                runtime.stuck_values.clear()
-                if fault_settings.mode == "random":
-                    runtime.mode = random.choice(sorted(_FAULT_MODES - {"random"}))
-                else:
-                    runtime.mode = fault_settings.mode
-            if now <= runtime.active_until:
-                if fault_settings.kind in {"holding", "all"}:
-                    _apply_faults(
-                        holding,
-                        "holding",
-                        fault_settings.addresses,
-                        runtime.mode,
-                        fault_settings.magnitude,
-                        now,
-                        runtime.fault_start,
-                        fault_settings.duration,
-                        runtime.stuck_values,
-                    )
-                if fault_settings.kind in {"input", "all"}:
-                    _apply_faults(
-                        inputs,
-                        "input",
-                        fault_settings.addresses,
-                        runtime.mode,
-                        fault_settings.magnitude,
-                        now,
-                        runtime.fault_start,
-                        fault_settings.duration,
-                        runtime.stuck_values,
-                    )
-
-        if outlier_settings.enabled:
-            if outlier_settings.kind in {"holding", "all"}:
-                _apply_outliers(
-                    holding,
-                    outlier_settings.addresses,
-                    outlier_settings.mode,
-                    outlier_settings.probability,
-                    outlier_settings.magnitude,
+        if fault_mode is not None:
+            if fault_holding:
+                apply_faults(
+                    holding_values,
+                    "holding",
+                    fault_addresses,
+                    fault_mode,
+                    fault_settings.magnitude,
+                    now,
+                    runtime.fault_start,
+                    fault_settings.duration,
+                    runtime.stuck_values,
                 )
-            if outlier_settings.kind in {"input", "all"}:
-                _apply_outliers(
-                    inputs,
-                    outlier_settings.addresses,
-                    outlier_settings.mode,
-                    outlier_settings.probability,
-                    outlier_settings.magnitude,
+            if fault_input:
+                apply_faults(
+                    input_values,
+                    "input",
+                    fault_addresses,
+                    fault_mode,
+                    fault_settings.magnitude,
+                    now,
+                    runtime.fault_start,
+                    fault_settings.duration,
+                    runtime.stuck_values,
                 )
 
-        slave_id = 0x00
-        context[slave_id].setValues(3, 0, holding)  # holding registers
-        context[slave_id].setValues(4, 0, inputs)  # input registers
-        context[slave_id].setValues(1, 0, coils)  # coils
-        context[slave_id].setValues(2, 0, discrete)  # discrete inputs
+        if outlier_holding:
+            apply_outliers(
+                holding_values,
+                outlier_addresses,
+                outlier_settings.mode,
+                outlier_settings.probability,
+                outlier_settings.magnitude,
+            )
+        if outlier_input:
+            apply_outliers(
+                input_values,
+                outlier_addresses,
+                outlier_settings.mode,
+                outlier_settings.probability,
+                outlier_settings.magnitude,
+            )
+
+        first_tick = tick == 1
+        if _HAS_NUMPY:
+            # Lists only at the pymodbus boundary.
+            if first_tick or not holding_static:
+                set_holding(holding_values.tolist())
+            if first_tick or not input_static:
+                set_inputs(input_values.tolist())
+        else:
+            if first_tick or not holding_static:
+                set_holding(holding_values)
+            if first_tick or not input_static:
+                set_inputs(input_values)
+        if tick & 1:
+            set_coils(odd_bits)
+            set_discrete(even_bits)
+        else:
+            set_coils(even_bits)
+            set_discrete(odd_bits)
+
+        deadline += period
+        delay = deadline - monotonic()
+        if delay < 0:
+            deadline -= delay
+            delay = 0.0
+        await asyncio.sleep(delay)
+
 
-        await asyncio.sleep(period)
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for the simulator, preferring uvloop when installed."""
+    if _HAS_UVLOOP:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
 
 
 async def run_simulated_server(
@@ -436,7 +731,9 @@ async def run_simulated_server(
             await updater
 
 
-def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # parse_args() leaves the parser untouched, so one instance serves every call.
     parser = argparse.ArgumentParser(description="Run a simulated Modbus TCP server.")
     parser.add_argument(
         "--host", default="127.0.0.1", help="Bind host (default: 127.0.0.1)"
@@ -586,111 +883,88 @@ def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
         default=argparse.SUPPRESS,
         help="Magnitude for drop/spike/drift faults (default: 300)",
     )
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    return _build_parser().parse_args(args)
+
+
+# (argparse dest, dataclass field) pairs copied verbatim from the CLI.
+_SIGNAL_OPTIONS = (
+    ("holding_signal", "holding_signal"),
+    ("input_signal", "input_signal"),
+    ("signal_amplitude", "amplitude"),
+    ("signal_offset", "offset"),
+    ("signal_noise", "noise"),
+    ("phase_step", "phase_step"),
+    ("phase_shift", "phase_shift"),
+)
 
 
 def main(argv: Sequence[str] | None = None) -> None:
     options = parse_args(argv)
     count = max(1, min(200, options.register_count))
-    signal_settings = SignalSettings(count=count)
-    fault_settings = FaultSettings()
-    outlier_settings = OutlierSettings()
 
+    # Collect every override first, then build each settings object once.
     profile_name = getattr(options, "fault_profile", "none")
-    if profile_name != "none":
-        signal_settings, fault_settings, outlier_settings = _apply_profile(
-            signal_settings, fault_settings, outlier_settings, profile_name, count
-        )
+    signal_overrides, fault_overrides, outlier_overrides = _profile_overrides(
+        profile_name, count
+    )
 
-    if hasattr(options, "holding_signal"):
-        signal_settings = replace(
-            signal_settings, holding_signal=options.holding_signal
-        )
-    if hasattr(options, "input_signal"):
-        signal_settings = replace(signal_settings, input_signal=options.input_signal)
-    if hasattr(options, "signal_amplitude"):
-        signal_settings = replace(signal_settings, amplitude=options.signal_amplitude)
-    if hasattr(options, "signal_offset"):
-        signal_settings = replace(signal_settings, offset=options.signal_offset)
-    if hasattr(options, "signal_noise"):
-        signal_settings = replace(signal_settings, noise=options.signal_noise)
-    if hasattr(options, "phase_step"):
-        signal_settings = replace(signal_settings, phase_step=options.phase_step)
-    if hasattr(options, "phase_shift"):
-        signal_settings = replace(signal_settings, phase_shift=options.phase_shift)
+    for dest, name in _SIGNAL_OPTIONS:
+        if hasattr(options, dest):
+            signal_overrides[name] = getattr(options, dest)
     if hasattr(options, "cycle_seconds") and not hasattr(options, "phase_step"):
         cycle_seconds = max(0.1, options.cycle_seconds)
         period_seconds = max(0.01, options.period)
-        signal_settings = replace(
-            signal_settings, phase_step=(math.tau * period_seconds) / cycle_seconds
-        )
-    signal_settings = replace(signal_settings, count=count)
+        signal_overrides["phase_step"] = (math.tau * period_seconds) / cycle_seconds
+    signal_overrides["count"] = count
 
-    fault_overrides_used = False
+    fault_cli: dict[str, Any] = {}
     if hasattr(options, "fault_kind"):
-        fault_settings = replace(fault_settings, kind=options.fault_kind)
-        fault_overrides_used = True
+        fault_cli["kind"] = options.fault_kind
     if hasattr(options, "fault_addresses"):
-        fault_settings = replace(
-            fault_settings, addresses=_parse_addresses(options.fault_addresses, count)
-        )
-        fault_overrides_used = True
+        fault_cli["addresses"] = _parse_addresses(options.fault_addresses, count)
     if hasattr(options, "fault_mode"):
-        fault_settings = replace(fault_settings, mode=options.fault_mode)
-        fault_overrides_used = True
+        fault_cli["mode"] = options.fault_mode
     if hasattr(options, "fault_every"):
-        fault_settings = replace(fault_settings, every=max(0.1, options.fault_every))
-        fault_overrides_used = True
+        fault_cli["every"] = max(0.1, options.fault_every)
     if hasattr(options, "fault_duration"):
-        fault_settings = replace(
-            fault_settings, duration=max(0.1, options.fault_duration)
-        )
-        fault_overrides_used = True
+        fault_cli["duration"] = max(0.1, options.fault_duration)
     if hasattr(options, "fault_magnitude"):
-        fault_settings = replace(fault_settings, magnitude=options.fault_magnitude)
-        fault_overrides_used = True
-    if hasattr(options, "fault_enable") or (
-        profile_name == "none" and fault_overrides_used
-    ):
-        fault_settings = replace(fault_settings, enabled=True)
-
-    outlier_overrides_used = False
+        fault_cli["magnitude"] = options.fault_magnitude
+    fault_overrides.update(fault_cli)
+    if hasattr(options, "fault_enable") or (profile_name == "none" and fault_cli):
+        fault_overrides["enabled"] = True
+
+    outlier_cli: dict[str, Any] = {}
     if hasattr(options, "outlier_kind"):
-        outlier_settings = replace(outlier_settings, kind=options.outlier_kind)
-        outlier_overrides_used = True
+        outlier_cli["kind"] = options.outlier_kind
     if hasattr(options, "outlier_addresses"):
-        outlier_settings = replace(
-            outlier_settings,
-            addresses=_parse_addresses(options.outlier_addresses, count),
-        )
-        outlier_overrides_used = True
+        outlier_cli["addresses"] = _parse_addresses(options.outlier_addresses, count)
     if hasattr(options, "outlier_mode"):
-        outlier_settings = replace(outlier_settings, mode=options.outlier_mode)
-        outlier_overrides_used = True
+        outlier_cli["mode"] = options.outlier_mode
     if hasattr(options, "outlier_probability"):
-        outlier_settings = replace(
-            outlier_settings,
-            probability=max(0.0, min(1.0, options.outlier_probability)),
-        )
-        outlier_overrides_used = True
+        outlier_cli["probability"] = max(0.0, min(1.0, options.outlier_probability))
     if hasattr(options, "outlier_magnitude"):
-        outlier_settings = replace(
-            outlier_settings, magnitude=options.outlier_magnitude
-        )
-        outlier_overrides_used = True
-    if hasattr(options, "outlier_enable") or outlier_overrides_used:
-        outlier_settings = replace(outlier_settings, enabled=True)
-
-    asyncio.run(
-        run_simulated_server(
-            options.host,
-            options.port,
-            options.period,
-            signal_settings=signal_settings,
-            fault_settings=fault_settings,
-            outlier_settings=outlier_settings,
-        )
+        outlier_cli["magnitude"] = options.outlier_magnitude
+    outlier_overrides.update(outlier_cli)
+    if hasattr(options, "outlier_enable") or outlier_cli:
+        outlier_overrides["enabled"] = True
+
+    server = run_simulated_server(
+        options.host,
+        options.port,
+        options.period,
+        signal_settings=SignalSettings(**signal_overrides),
+        fault_settings=FaultSettings(**fault_overrides),
+        outlier_settings=OutlierSettings(**outlier_overrides),
     )
+    if _HAS_UVLOOP:
+        uvloop.run(server)
+    else:
+        asyncio.run(server)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,11 +1,12 @@
 import asyncio
 import socket
 import threading
-import time
 
 import pytest
+from fastapi.testclient import TestClient
 
-from py_modbus_web_monitor.utils.sim_server import run_simulated_server
+from py_modbus_web_monitor.api import app
+from py_modbus_web_monitor.utils.sim_server import new_event_loop, run_simulated_server
 
 
 def is_port_open(host, port):
@@ -21,40 +22,45 @@ def modbus_server():
         s.bind(("", 0))
         port = s.getsockname()[1]
 
-    # We use a mutable container to signal the server to stop
-    status = {"running": True}
+    # Set from the server thread once the listener accepts connections
+    ready = threading.Event()
+    loop = new_event_loop()
+    server_task = loop.create_task(run_simulated_server(host, port, period=0.1))
+
+    async def signal_ready():
+        # Probe from inside the loop so readiness is seen as soon as the
+        # listener is bound, rather than on a coarse polling interval.
+        while not server_task.done():
+            if is_port_open(host, port):
+                ready.set()
+                return
+            await asyncio.sleep(0.01)
 
     def run_server():
-        loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-
-        server_task = loop.create_task(run_simulated_server(host, port, period=0.1))
-
-        async def wait_for_stop():
-            while status["running"]:
-                await asyncio.sleep(0.1)
-            server_task.cancel()
-            try:
-                await server_task
-            except asyncio.CancelledError:
-                pass
-            loop.stop()
-
-        loop.create_task(wait_for_stop())
-        loop.run_forever()
+        loop.create_task(signal_ready())
+        try:
+            loop.run_until_complete(server_task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
 
     thread = threading.Thread(target=run_server, daemon=True)
     thread.start()
 
-    # Wait for the server to start
-    timeout = 5
-    start_time = time.time()
-    while not is_port_open(host, port):
-        if time.time() - start_time > timeout:
-            pytest.fail("Simulated Modbus server failed to start")
-        time.sleep(0.1)
+    if not ready.wait(timeout=5):
+        pytest.fail("Simulated Modbus server failed to start")
 
     yield host, port
 
-    status["running"] = False
+    loop.call_soon_threadsafe(server_task.cancel)
     thread.join(timeout=2)
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One client for the whole run: the lifespan (and its event loop thread)
+    # starts once, so pooled Modbus sessions are reused across tests.
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from py_modbus_web_monitor import api
+from py_modbus_web_monitor.data_logger import SQLiteDataLogger
+from py_modbus_web_monitor.schemas import ConnectionSettings
+
+CONNECTION = {"protocol": "tcp", "host": "127.0.0.1", "port": 1502, "unitId": 1}
+
+
+@pytest.fixture
+def seeded_logger(tmp_path, monkeypatch):
+    data_logger = SQLiteDataLogger(
+        db_path=tmp_path / "readings.sqlite", kinds={"holding"}, enabled=True
+    )
+    connection = ConnectionSettings.model_validate(CONNECTION)
+
+    async def seed():
+        # Address 0 follows a period-4 pattern and ends with a spike.
+        for tick in range(40):
+            value = 100.0 if tick == 39 else float(tick % 4)
+            await data_logger.log_readings(
+                connection,
+                [{"kind": "holding", "address": 0, "values": [value, 5]}],
+                source="test",
+                timestamp=f"2024-01-01T00:00:{tick:02d}+00:00",
+            )
+        await data_logger.flush()
+
+    asyncio.run(seed())
+    monkeypatch.setattr(api, "get_data_logger", lambda: data_logger)
+    yield data_logger
+    data_logger.close()
+
+
+def _payload():
+    return {
+        "connection": CONNECTION,
+        "targets": [{"kind": "holding", "address": 0, "count": 3}],
+        "window": 30,
+        "min_samples": 10,
+    }
+
+
+def test_anomaly_zscore(client, seeded_logger):
+    response = client.post("/api/anomaly/zscore", json=_payload())
+    assert response.status_code == 200
+    entry = response.json()["data"][0]
+    assert entry["values"] == [100.0, 5.0, None]
+    assert entry["sample_counts"] == [30, 30, 0]
+    assert entry["z_scores"][0] > 3
+    assert entry["z_scores"][1] == 0.0
+    assert entry["z_scores"][2] is None
+
+
+@pytest.mark.skipif(api.STL is None, reason="statsmodels not installed")
+def test_anomaly_stl(client, seeded_logger):
+    response = client.post("/api/anomaly/stl", json=_payload())
+    assert response.status_code == 200
+    entry = response.json()["data"][0]
+    assert entry["values"] == [100.0, 5.0, None]
+    assert entry["sample_counts"] == [30, 30, 0]
+    assert isinstance(entry["z_scores"][0], float)
+    assert entry["z_scores"][2] is None
+
+
+def test_stl_pool_falls_back_to_threads(monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise OSError("no semaphore support")
+
+    monkeypatch.setattr(api, "ProcessPoolExecutor", unavailable)
+    monkeypatch.setattr(api, "_STL_POOL", None)
+    monkeypatch.setattr(api, "_STL_POOL_UNAVAILABLE", False)
+    monkeypatch.setattr(api, "_STL_WORKERS", 2)
+    assert api._get_stl_pool() is None
+    assert api._STL_POOL_UNAVAILABLE
+
+
+def test_period_cache_keys_hold_no_values(monkeypatch):
+    monkeypatch.setattr(api, "_PERIOD_CACHE", {})
+    values = [float(tick % 4) for tick in range(40)]
+    window_hash = hash(tuple(values))
+    assert api._estimate_period(values, 10, window_hash) == 4
+    assert api._estimate_period(values, 10, window_hash) == 4
+    assert list(api._PERIOD_CACHE) == [(40, window_hash, 10)]
@@ -1,14 +1,3 @@
-import pytest
-from fastapi.testclient import TestClient
-
-from py_modbus_web_monitor.api import app
-
-
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-
 def test_read_registers(client, modbus_server):
     host, port = modbus_server
     payload = {
@@ -80,3 +69,13 @@ def test_invalid_connection(client):
     }
     response = client.post("/api/modbus/read", json=payload)
     assert response.status_code == 502
+
+
+def test_invalid_payload_returns_422(client):
+    payload = {
+        "connection": {"protocol": "tcp", "host": "127.0.0.1", "port": 502},
+        "targets": [{"kind": "bogus", "address": 0}],
+    }
+    response = client.post("/api/modbus/read", json=payload)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "targets", 0, "kind"]
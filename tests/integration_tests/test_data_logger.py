@@ -0,0 +1,284 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+import py_modbus_web_monitor.data_logger as logger_module
+from py_modbus_web_monitor.data_logger import (
+    SQLiteDataLogger,
+    _recent_range_sql,
+    compute_z_score,
+)
+from py_modbus_web_monitor.schemas import ConnectionSettings
+
+
+def _connection():
+    return ConnectionSettings(host="127.0.0.1", port=1502, unitId=1)
+
+
+@pytest.fixture
+def make_data_logger(tmp_path):
+    """Build enabled loggers in ``tmp_path``; all are closed on teardown."""
+    loggers = []
+
+    def make(**options):
+        options.setdefault("kinds", {"holding"})
+        data_logger = SQLiteDataLogger(
+            db_path=tmp_path / "readings.sqlite", enabled=True, **options
+        )
+        loggers.append(data_logger)
+        return data_logger
+
+    yield make
+    for data_logger in loggers:
+        data_logger.close()
+
+
+@pytest.fixture
+def data_logger(make_data_logger):
+    return make_data_logger()
+
+
+def test_log_and_fetch_recent_values(data_logger):
+    connection = _connection()
+
+    async def scenario():
+        for value in (1, 2, 3):
+            await data_logger.log_readings(
+                connection,
+                [{"kind": "holding", "address": 4, "values": [value, value * 10]}],
+                source="test",
+                timestamp=f"2024-01-01T00:00:0{value}+00:00",
+            )
+        return await data_logger.fetch_recent_values(
+            connection, kind="holding", address=4, limit=2
+        )
+
+    assert asyncio.run(scenario()) == [3.0, 2.0]
+
+
+def test_close_reopens_lazily(data_logger):
+    connection = _connection()
+    reading = [{"kind": "holding", "address": 0, "values": [7]}]
+
+    async def scenario():
+        await data_logger.log_readings(connection, reading, source="test")
+        data_logger.close()
+        await data_logger.log_readings(connection, reading, source="test")
+        return await data_logger.fetch_recent_values(
+            connection, kind="holding", address=0, limit=10
+        )
+
+    assert asyncio.run(scenario()) == [7.0, 7.0]
+
+
+def test_writer_coalesces_batches(make_data_logger):
+    data_logger = make_data_logger(max_batch=4, max_delay_ms=0)
+    connection = _connection()
+    reading = [{"kind": "holding", "address": 1, "values": list(range(10))}]
+
+    async def scenario():
+        await data_logger.log_readings(connection, reading, source="test")
+        await data_logger.flush()
+        values = []
+        for offset in range(10):
+            values.extend(
+                await data_logger.fetch_recent_values(
+                    connection, kind="holding", address=1 + offset, limit=1
+                )
+            )
+        return values
+
+    assert asyncio.run(scenario()) == [float(value) for value in range(10)]
+
+
+def test_flush_keeps_arrival_order(make_data_logger):
+    data_logger = make_data_logger(max_delay_ms=5000)
+    connection = _connection()
+
+    async def scenario():
+        for value in (1, 2):
+            await data_logger.log_readings(
+                connection,
+                [{"kind": "holding", "address": 0, "values": [value]}],
+                source="test",
+            )
+            # Let the writer dequeue the first reading and start coalescing.
+            await asyncio.sleep(0)
+        # flush() must not wait out the coalescing delay or overtake the writer.
+        await asyncio.wait_for(data_logger.flush(), timeout=1)
+        return await data_logger.fetch_recent_values(
+            connection, kind="holding", address=0, limit=2
+        )
+
+    assert asyncio.run(scenario()) == [2.0, 1.0]
+
+
+def test_new_loop_carries_over_inflight_batch(make_data_logger):
+    data_logger = make_data_logger(max_delay_ms=5000)
+    connection = _connection()
+
+    async def log(value):
+        await data_logger.log_readings(
+            connection,
+            [{"kind": "holding", "address": 0, "values": [value]}],
+            source="test",
+        )
+        await asyncio.sleep(0)
+
+    async def log_and_fetch():
+        await log(2)
+        return await data_logger.fetch_recent_values(
+            connection, kind="holding", address=0, limit=10
+        )
+
+    # The first loop ends while the writer still holds its batch.
+    asyncio.run(log(1))
+    assert asyncio.run(log_and_fetch()) == [2.0, 1.0]
+
+
+def test_fetch_recent_values_range(data_logger):
+    connection = _connection()
+
+    async def scenario():
+        for tick in range(3):
+            await data_logger.log_readings(
+                connection,
+                [{"kind": "holding", "address": 10, "values": [tick, tick + 100]}],
+                source="test",
+                timestamp=f"2024-01-01T00:00:0{tick}+00:00",
+            )
+        newest_first = await data_logger.fetch_recent_values_range(
+            connection, kind="holding", base_address=10, count=3, limit=2
+        )
+        oldest_first = await data_logger.fetch_recent_values_range(
+            connection,
+            kind="holding",
+            base_address=10,
+            count=3,
+            limit=2,
+            oldest_first=True,
+        )
+        return newest_first, oldest_first
+
+    newest_first, oldest_first = asyncio.run(scenario())
+    assert newest_first == {10: [2.0, 1.0], 11: [102.0, 101.0], 12: []}
+    assert oldest_first == {10: [1.0, 2.0], 11: [101.0, 102.0], 12: []}
+
+
+def test_fetch_recent_values_range_over_long_history(data_logger):
+    connection = _connection()
+    ticks = 5000
+
+    async def scenario():
+        for tick in range(ticks):
+            await data_logger.log_readings(
+                connection,
+                [{"kind": "holding", "address": 0, "values": [tick] * 4}],
+                source="test",
+            )
+        return await data_logger.fetch_recent_values_range(
+            connection, kind="holding", base_address=0, count=4, limit=3
+        )
+
+    newest = [float(ticks - 1), float(ticks - 2), float(ticks - 3)]
+    assert asyncio.run(scenario()) == {address: newest for address in range(4)}
+    # Each address is a bounded index probe, never a scan of the history.
+    plan = data_logger._ensure_initialized().execute(
+        "EXPLAIN QUERY PLAN " + _recent_range_sql(4, False),
+        ("127.0.0.1", 1502, 1, "holding", 3, 0, 1, 2, 3),
+    )
+    details = [row[-1] for row in plan]
+    assert not [d for d in details if d.startswith("SCAN readings")]
+    assert sum("idx_readings_series_recent" in d for d in details) == 4
+
+
+def test_bit_kinds_are_stored_as_numbers(make_data_logger):
+    data_logger = make_data_logger(kinds={"coil"})
+    connection = _connection()
+
+    async def scenario():
+        await data_logger.log_readings(
+            connection,
+            [{"kind": "coil", "address": 0, "values": [True, False]}],
+            source="test",
+        )
+        return await data_logger.fetch_recent_values_range(
+            connection, kind="coil", base_address=0, count=2, limit=1
+        )
+
+    assert asyncio.run(scenario()) == {0: [1.0], 1: [0.0]}
+
+
+def test_large_batch_is_split_across_inserts(data_logger, monkeypatch):
+    monkeypatch.setattr(logger_module, "_MAX_ROWS_PER_INSERT", 7)
+    connection = _connection()
+    reading = [{"kind": "holding", "address": 0, "values": list(range(20))}]
+
+    async def scenario():
+        await data_logger.log_readings(connection, reading, source="test")
+        return await data_logger.fetch_recent_values_range(
+            connection, kind="holding", base_address=0, count=20, limit=1
+        )
+
+    assert asyncio.run(scenario()) == {i: [float(i)] for i in range(20)}
+
+
+def test_log_readings_drops_when_backlog_is_full(make_data_logger):
+    data_logger = make_data_logger(max_queue=3)
+    connection = _connection()
+
+    async def scenario():
+        # log_readings never suspends, so the writer cannot drain in between.
+        await data_logger.log_readings(
+            connection,
+            [{"kind": "holding", "address": 0, "values": [1, 2]}],
+            source="test",
+        )
+        await data_logger.log_readings(
+            connection,
+            [{"kind": "holding", "address": 0, "values": [3, 4]}],
+            source="test",
+        )
+        return await data_logger.fetch_recent_values(
+            connection, kind="holding", address=0, limit=10
+        )
+
+    assert asyncio.run(scenario()) == [1.0]
+
+
+def test_reset_keeps_previous_logger_until_released(tmp_path, monkeypatch):
+    paths = iter(tmp_path / f"session{i}.sqlite" for i in range(2))
+    monkeypatch.setattr(logger_module, "_resolve_db_path", lambda: next(paths))
+    monkeypatch.setattr(logger_module, "_DATA_LOGGER", None)
+    monkeypatch.setattr(logger_module, "_RETIRED_LOGGERS", set())
+    reading = [{"kind": "holding", "address": 0, "values": [1]}]
+
+    async def scenario():
+        first = logger_module.reset_data_logger()
+        second = logger_module.reset_data_logger()
+        # The first session keeps logging to its own file after the reset.
+        await first.log_readings(_connection(), reading, source="test")
+        await logger_module.release_data_logger(first)
+        await logger_module.release_data_logger(second)  # still active: left open
+        assert first._conn is None
+        assert (
+            logger_module._DATA_LOGGER is second and not logger_module._RETIRED_LOGGERS
+        )
+        await second.log_readings(_connection(), reading, source="test")
+        await logger_module.shutdown_data_logger()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert second._conn is None
+    for data_logger in (first, second):
+        with sqlite3.connect(data_logger.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM readings").fetchone() == (1,)
+
+
+def test_z_score_of_constant_non_integer_series_is_zero():
+    z_score, mean, stdev = compute_z_score([0.1] * 30, 5)
+    assert (z_score, stdev) == (0.0, 0.0)
+    assert mean == pytest.approx(0.1)
+    z_score, _, _ = compute_z_score([5.0, 1.0, 2.0, 3.0], 3)
+    assert z_score == pytest.approx(3.0)
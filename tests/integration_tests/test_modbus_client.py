@@ -0,0 +1,110 @@
+import asyncio
+import socket
+
+from py_modbus_web_monitor import modbus_client
+from py_modbus_web_monitor.modbus_client import close_all_sessions, tcp_session
+from py_modbus_web_monitor.schemas import ConnectionSettings, ReadTarget
+
+
+def test_tcp_session_reuses_pooled_connection(modbus_server):
+    host, port = modbus_server
+    settings = ConnectionSettings(host=host, port=port, unitId=1)
+    target = ReadTarget(kind="holding", address=50, count=1)
+
+    async def scenario():
+        try:
+            async with tcp_session(settings) as first:
+                await first.read(target)
+            async with tcp_session(settings) as second:
+                await second.read(target)
+            return first is second, second.connected
+        finally:
+            await close_all_sessions()
+
+    assert asyncio.run(scenario()) == (True, True)
+
+
+def test_read_many_matches_individual_reads(modbus_server):
+    host, port = modbus_server
+    settings = ConnectionSettings(host=host, port=port, unitId=1)
+    # Addresses outside the range the simulator rewrites every tick.
+    targets = [
+        ReadTarget(kind="holding", address=52, count=2),
+        ReadTarget(kind="coil", address=100, count=3),
+        ReadTarget(kind="holding", address=50, count=3),
+        ReadTarget(kind="holding", address=80, count=1),
+    ]
+
+    async def scenario():
+        try:
+            async with tcp_session(settings) as session:
+                merged = await session.read_many(targets)
+                single = [await session.read(target) for target in targets]
+            return merged, single
+        finally:
+            await close_all_sessions()
+
+    merged, single = asyncio.run(scenario())
+    assert merged == single
+    assert [len(values) for values in merged] == [2, 3, 3, 1]
+
+
+def test_read_many_spreads_reads_across_connections(modbus_server, monkeypatch):
+    monkeypatch.setattr(modbus_client, "_READ_CONNECTIONS", 3)
+    host, port = modbus_server
+    settings = ConnectionSettings(host=host, port=port, unitId=1)
+    targets = [
+        ReadTarget(kind="holding", address=50, count=2),
+        ReadTarget(kind="holding", address=60, count=2),
+        ReadTarget(kind="coil", address=100, count=3),
+    ]
+
+    async def scenario():
+        session = modbus_client.ModbusTcpSession(settings)
+        await session.connect()
+        try:
+            merged = await session.read_many(targets)
+            single = [await session.read(target) for target in targets]
+            return len(session._clients), merged, single
+        finally:
+            await session.close()
+
+    lanes, merged, single = asyncio.run(scenario())
+    assert lanes == 3
+    assert merged == single
+
+
+def test_idle_pooled_connection_is_kept_alive(modbus_server, monkeypatch):
+    monkeypatch.setattr(modbus_client, "_POOL_KEEPALIVE", 0.05)
+    monkeypatch.setattr(modbus_client, "_POOL_KEEPALIVE_KIND", "holding")
+    monkeypatch.setattr(modbus_client, "_POOL_KEEPALIVE_ADDRESS", 50)
+    probes = []
+    read = modbus_client.ModbusTcpSession.read
+
+    async def recording_read(self, target, unit_id=None):
+        probes.append((target.kind, target.address))
+        return await read(self, target, unit_id)
+
+    monkeypatch.setattr(modbus_client.ModbusTcpSession, "read", recording_read)
+    host, port = modbus_server
+    settings = ConnectionSettings(host=host, port=port, unitId=1)
+
+    async def scenario():
+        try:
+            async with tcp_session(settings) as session:
+                transport = session._client.ctx.transport
+                sock = transport.get_extra_info("socket")
+                keepalive = sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            await asyncio.sleep(0.2)
+            entry = modbus_client._POOL[modbus_client._pool_key(settings)]
+            probing = (
+                entry.keepalive_task is not None and not entry.keepalive_task.done()
+            )
+            return keepalive, probing, session.connected
+        finally:
+            await close_all_sessions()
+
+    keepalive, probing, connected = asyncio.run(scenario())
+    assert keepalive
+    assert probing and connected
+    assert probes and set(probes) == {("holding", 50)}
@@ -1,14 +1,26 @@
+import asyncio
 import json
+import struct
 
 import pytest
-from fastapi.testclient import TestClient
 
-from py_modbus_web_monitor.api import app
+from py_modbus_web_monitor import monitor
+from py_modbus_web_monitor.monitor import (
+    _decode_command_pydantic,
+    _pack_bits,
+    _update_frame_encoder,
+)
+from py_modbus_web_monitor.schemas import ReadTarget
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
+def _receive_until(websocket, predicate, limit=5):
+    """Return the first of the next ``limit`` messages matching ``predicate``."""
+    messages = (websocket.receive_json() for _ in range(limit))
+    return next(filter(predicate, messages), None)
+
+
+def _is_update(msg):
+    return msg["type"] == "update"
 
 
 def test_websocket_monitor(client, modbus_server):
@@ -32,12 +44,7 @@ def test_websocket_monitor(client, modbus_server):
 
         # 3. Receive at least one update
         # Sometimes there might be a small delay, let's wait for 'update' type
-        update = None
-        for _ in range(5):
-            msg = websocket.receive_json()
-            if msg["type"] == "update":
-                update = msg
-                break
+        update = _receive_until(websocket, _is_update)
 
         assert update is not None
         assert update["type"] == "update"
@@ -53,6 +60,7 @@ def test_websocket_write_through_monitor(client, modbus_server):
         config = {
             "type": "configure",
             "connection": {"protocol": "tcp", "host": host, "port": port, "unitId": 1},
+            "interval": 0.1,
             "targets": [{"kind": "holding", "address": 60, "count": 1}],
         }
         websocket.send_json(config)
@@ -67,17 +75,13 @@ def test_websocket_write_through_monitor(client, modbus_server):
 
         # 3. Wait for an update that reflects the write (or just check next update)
         # Note: it might take a cycle to see the new value
-        found = False
-        for _ in range(5):
-            update = websocket.receive_json()
-            if update["type"] == "update":
-                for entry in update["data"]:
-                    if entry["address"] == 60 and entry["values"][0] == 555:
-                        found = True
-                        break
-            if found:
-                break
-        assert found
+        def shows_write(msg):
+            return _is_update(msg) and any(
+                entry["address"] == 60 and entry["values"][0] == 555
+                for entry in msg["data"]
+            )
+
+        assert _receive_until(websocket, shows_write) is not None
 
 
 def test_websocket_invalid_first_message(client):
@@ -86,3 +90,150 @@ def test_websocket_invalid_first_message(client):
         msg = websocket.receive_json()
         assert msg["type"] == "error"
         assert "First message must be a 'configure' command" in msg["message"]
+
+
+def test_websocket_commands_on_open_socket(client, modbus_server):
+    host, port = modbus_server
+    with client.websocket_connect("/ws/monitor") as websocket:
+        websocket.send_json(
+            {
+                "type": "configure",
+                "connection": {"host": host, "port": port, "unitId": 1},
+                "interval": 0.5,
+                "targets": [{"kind": "holding", "address": 70, "count": 1}],
+            }
+        )
+        websocket.receive_json()  # skip status
+
+        websocket.send_json({"type": "write", "writes": []})
+        websocket.send_json({"type": "ping"})
+        received = []
+        for _ in range(6):
+            msg = websocket.receive_json()
+            received.append(msg["type"])
+            if msg["type"] == "pong":
+                break
+        assert "error" in received
+        assert received[-1] == "pong"
+
+        # Binary frames are accepted too and decoded without a str round-trip.
+        websocket.send_bytes(b'{"type":"ping"}')
+        pong = _receive_until(websocket, lambda msg: msg["type"] == "pong", limit=6)
+        assert pong is not None, "no pong for binary ping"
+
+
+def test_update_frame_encoder_matches_plain_json():
+    targets = [
+        ReadTarget(kind="holding", address=5, count=2, label="Tank"),
+        ReadTarget(kind="coil", address=9, count=1),
+    ]
+    frame = _update_frame_encoder(targets)(
+        "2024-01-01T00:00:00+00:00", [[1, 2], [True]]
+    )
+    assert json.loads(frame) == {
+        "type": "update",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "data": [
+            {"address": 5, "kind": "holding", "label": "Tank", "values": [1, 2]},
+            {"address": 9, "kind": "coil", "label": "coil:9", "values": [True]},
+        ],
+    }
+
+
+def test_websocket_monitor_binary_frames(client, modbus_server):
+    host, port = modbus_server
+    with client.websocket_connect("/ws/monitor") as websocket:
+        websocket.send_json(
+            {
+                "type": "configure",
+                "connection": {"host": host, "port": port, "unitId": 1},
+                "interval": 0.1,
+                "encoding": "binary",
+                "targets": [
+                    {"kind": "holding", "address": 50, "count": 2},
+                    {"kind": "coil", "address": 100, "count": 3},
+                ],
+            }
+        )
+        # Status messages stay JSON text; updates arrive as binary frames.
+        message = websocket.receive()
+        while "bytes" not in message:
+            assert json.loads(message["text"])["type"] == "status"
+            message = websocket.receive()
+        frame = message["bytes"]
+        (header_len,) = struct.unpack_from(">I", frame)
+        header = json.loads(frame[4 : 4 + header_len])
+        payload = frame[4 + header_len :]
+
+    assert header["type"] == "update"
+    assert [t["count"] for t in header["targets"]] == [2, 3]
+    assert len(payload) == 2 * 2 + 1
+
+
+def test_offer_frame_drops_oldest_when_full(monkeypatch):
+    monkeypatch.setattr(monitor, "_FRAME_QUEUE_SIZE", 2)
+    frames = asyncio.Queue()
+    for frame in ("a", "b", "c"):
+        monitor._offer_frame(frames, frame, droppable=True)
+    assert [frames.get_nowait()[0] for _ in range(2)] == ["b", "c"]
+
+
+def test_write_frames_keeps_errors_in_order_with_updates(monkeypatch):
+    class _Socket:
+        def __init__(self):
+            self.sent = []
+
+        async def send_text(self, frame):
+            self.sent.append(frame)
+
+    async def scenario():
+        frames = asyncio.Queue()
+        monitor._offer_frame(frames, "update-1", droppable=True)
+        monitor._offer_frame(frames, "error-1")
+        for index in range(2, 5):
+            monitor._offer_frame(frames, f"update-{index}", droppable=True)
+        monitor._offer_frame(frames, "error-2")
+        monitor._offer_frame(frames, None)
+        socket = _Socket()
+        await monitor._write_frames(socket, frames)
+        return socket.sent
+
+    monkeypatch.setattr(monitor, "_FRAME_QUEUE_SIZE", 4)
+    # Updates make room for later frames; errors are never dropped.
+    assert asyncio.run(scenario()) == ["error-1", "update-4", "error-2"]
+
+
+def test_pack_bits_is_lsb_first():
+    assert _pack_bits([]) == b""
+    assert _pack_bits([True, False, False]) == b"\x01"
+    assert _pack_bits([False] * 8 + [True, True]) == b"\x00\x03"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"type":"ping"}',
+        '{"type":"write","writes":[{"kind":"holding","address":1,"value":7}]}',
+        '{"type":"write","writes":[{"kind":"coil","address":1,"value":true}]}',
+        '{"type":"write","writes":[{"kind":"holding","address":1,"value":1.0}]}',
+        '{"type":"write","writes":[{"kind":"holding","address":1,"value":"5"}]}',
+        '{"type":"write","writes":[{"kind":"holding","address":1,"value":[1,true]}]}',
+        '{"type":"write","writes":[{"kind":"coil","address":1,"value":[true,false]}]}',
+        '{"type":"write","writes":[{"kind":"holding","address":"3","value":2}]}',
+        '{"type":"write","writes":[{"kind":"holding","address":1,"value":1.5}]}',
+        '{"type":"write","writes":[]}',
+        '{"type":',
+    ],
+)
+def test_command_decoders_agree(raw):
+    msgspec_schemas = pytest.importorskip("py_modbus_web_monitor._msgspec_schemas")
+    fast = msgspec_schemas.CommandDecoder(fallback=_decode_command_pydantic).decode
+
+    def outcome(decode):
+        try:
+            command_type, writes = decode(raw)
+        except Exception:  # noqa: BLE001 - only whether it failed matters
+            return "error"
+        return command_type, [write.model_dump() for write in writes]
+
+    assert outcome(fast) == outcome(_decode_command_pydantic)
@@ -1,25 +1,31 @@
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
+ROOT_DIR = Path(__file__).resolve().parents[1]
+TESTS_DIR = str(ROOT_DIR / "tests")
+ALLURE_DIR = str(ROOT_DIR / "outputs" / "allure-results")
+
 
 def main():
     # Ensure the 'src' directory is in the python path
-    root_dir = Path(__file__).resolve().parents[1]
-    sys.path.insert(0, str(root_dir / "src"))
+    sys.path.insert(0, str(ROOT_DIR / "src"))
 
     # Run pytest on the tests directory
     args = [
-        str(root_dir / "tests"),
-        "-v",
+        TESTS_DIR,
+        "-q",
         "--tb=short",
-        f"--alluredir={root_dir / 'outputs' / 'allure-results'}",
+        f"--alluredir={ALLURE_DIR}",
         "--clean-alluredir",
     ]
+    # CI runners start from a clean checkout, so the cache is never read back
+    if os.getenv("CI"):
+        args.extend(["-p", "no:cacheprovider"])
     # Allow passing extra arguments
-    if len(sys.argv) > 1:
-        args.extend(sys.argv[1:])
+    args.extend(sys.argv[1:])
 
     return pytest.main(args)
 